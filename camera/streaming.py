@@ -22,6 +22,19 @@ CameraConfig = Camera
 class CameraStream:
     """Handles individual camera stream"""
 
+    # 카메라마다 1개씩 생성되는 객체이므로 __dict__ 대신 고정 슬롯 사용
+    __slots__ = (
+        'config',
+        'gst_pipeline',
+        'status',
+        '_reconnect_count',
+        '_last_frame_time',
+        '_stats',
+        'window_handle',
+        'recording_control_widget',
+        'rtsp_url',
+    )
+
     def __init__(self, config: Union[Camera, CameraConfig], recording_control_widget=None):
         """
         Initialize camera stream
@@ -7,7 +7,7 @@ import os
 import shutil
 import time
 from pathlib import Path
-from typing import Optional, List, Dict, Tuple
+from typing import Optional, List, Dict, Tuple, Callable
 from datetime import datetime, timedelta
 from loguru import logger
 
@@ -140,13 +140,15 @@ class StorageService:
             logger.error(f"Failed to check disk space: {e}")
             return 0.0, False
 
-    def cleanup_old_recordings(self, days: Optional[int] = None, force: bool = False) -> int:
+    def cleanup_old_recordings(self, days: Optional[int] = None, force: bool = False,
+                               should_stop: Optional[Callable[[], bool]] = None) -> int:
         """
         오래된 녹화 파일 정리
 
         Args:
             days: 보관 기간 (일), None이면 기본값 사용
             force: 강제 정리 여부
+            should_stop: 날짜 디렉토리 삭제 사이마다 호출, True 반환 시 중단 (프로그램 종료 등)
 
         Returns:
             삭제된 파일 수
@@ -166,6 +168,10 @@ class StorageService:
                     continue
 
                 for date_dir in camera_dir.iterdir():
+                    if should_stop is not None and should_stop():
+                        logger.info(f"Old recordings cleanup interrupted: {deleted_count} files deleted")
+                        return deleted_count
+
                     if not date_dir.is_dir():
                         continue
 
@@ -201,12 +207,14 @@ class StorageService:
             logger.error(f"Failed to cleanup old recordings: {e}")
             raise StorageError(f"Failed to cleanup old recordings: {e}")
 
-    def cleanup_by_space(self, target_free_gb: Optional[float] = None) -> int:
+    def cleanup_by_space(self, target_free_gb: Optional[float] = None,
+                         should_stop: Optional[Callable[[], bool]] = None) -> int:
         """
         공간 확보를 위한 정리 (오래된 파일부터 삭제)
 
         Args:
             target_free_gb: 목표 여유 공간 (GB), None이면 기본값 사용
+            should_stop: 파일 삭제 사이마다 호출, True 반환 시 중단 (프로그램 종료 등)
 
         Returns:
             삭제된 파일 수
@@ -248,6 +256,9 @@ class StorageService:
             for file_path, _ in all_files:
                 if current_free_gb >= target_free_gb:
                     break
+                if should_stop is not None and should_stop():
+                    logger.info(f"Space cleanup interrupted: {deleted_count} files deleted")
+                    break
 
                 try:
                     file_size = file_path.stat().st_size
@@ -276,10 +287,13 @@ class StorageService:
             logger.error(f"Failed to cleanup by space: {e}")
             raise StorageError(f"Failed to cleanup by space: {e}")
 
-    def auto_cleanup(self) -> int:
+    def auto_cleanup(self, should_stop: Optional[Callable[[], bool]] = None) -> int:
         """
         자동 정리 (정책에 따라)
 
+        Args:
+            should_stop: 삭제 사이마다 호출, True 반환 시 남은 정리를 중단 (프로그램 종료 등)
+
         Returns:
             삭제된 파일 수
         """
@@ -291,20 +305,20 @@ class StorageService:
             # 1. 공간 부족 체크
             if storage_info.needs_cleanup(self.cleanup_threshold_percent):
                 logger.info(f"Storage usage {storage_info.usage_percent:.1f}% exceeds threshold {self.cleanup_threshold_percent}%")
-                total_deleted += self.cleanup_by_space()
+                total_deleted += self.cleanup_by_space(should_stop=should_stop)
 
             # 2. 오래된 파일 체크
             if storage_info.oldest_recording:
                 age_days = (datetime.now() - storage_info.oldest_recording).days
                 if age_days > self.max_storage_days:
                     logger.info(f"Found recordings older than {self.max_storage_days} days")
-                    total_deleted += self.cleanup_old_recordings()
+                    total_deleted += self.cleanup_old_recordings(should_stop=should_stop)
 
             # 3. 여유 공간 체크
             free_gb, is_sufficient = self.check_disk_space()
             if not is_sufficient:
                 logger.warning(f"Insufficient disk space: {free_gb:.1f}GB")
-                total_deleted += self.cleanup_by_space()
+                total_deleted += self.cleanup_by_space(should_stop=should_stop)
 
             return total_deleted
 
@@ -15,8 +15,8 @@ from core.enums import AlertLevel
 class SystemMonitorThread(QThread):
     """시스템 리소스 모니터링 스레드 (성능 임계값 기반 경고 시스템 포함)"""
 
-    # 상태 업데이트 시그널 (CPU, Memory, Temp, Disk)
-    status_updated = pyqtSignal(float, float, float, float)
+    # 상태 업데이트 시그널 (CPU, Memory %, Memory MB, Temp, Disk)
+    status_updated = pyqtSignal(float, float, float, float, float)
 
     # 경고 레벨 시그널 (AlertLevel, 메시지)
     alert_triggered = pyqtSignal(str, str)
@@ -130,7 +130,7 @@ class SystemMonitorThread(QThread):
                 disk_free_gb = disk.free / (1024**3)
 
                 # 메인 스레드로 시그널 전송
-                self.status_updated.emit(cpu_percent, memory_percent, temp, disk_free_gb)
+                self.status_updated.emit(cpu_percent, memory_percent, memory_mb, temp, disk_free_gb)
 
                 # 성능 임계값 체크 및 경고
                 self._check_thresholds(cpu_percent, memory_mb, temp)
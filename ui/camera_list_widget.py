@@ -12,11 +12,6 @@ from PyQt5.QtCore import Qt, pyqtSignal, QTimer
 from PyQt5.QtGui import QColor
 from loguru import logger
 
-# Fix imports
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from ui.theme import ThemedWidget
 from core.config import ConfigManager, CameraConfigData
 from camera.streaming import CameraStream, CameraConfig
@@ -69,6 +64,9 @@ class CameraListWidget(ThemedWidget):
     camera_updated = pyqtSignal(CameraConfigData)
     camera_connected = pyqtSignal(str)  # Camera ID
     camera_disconnected = pyqtSignal(str)  # Camera ID
+    cameras_connected = pyqtSignal(list)  # Camera IDs (Connect All 일괄 결과)
+    cameras_disconnected = pyqtSignal(list)  # Camera IDs (Disconnect All 일괄 결과)
+    camera_reconnecting = pyqtSignal(str)  # Camera ID (초기 연결 실패 → 파이프라인 자동 재연결 중)
 
     def __init__(self, config_manager: ConfigManager = None, parent=None):
         super().__init__(parent)
@@ -189,7 +187,7 @@ class CameraListWidget(ThemedWidget):
         # 기존 CameraStream 객체들에도 위젯 설정
         for camera_id, stream in self.camera_streams.items():
             stream.recording_control_widget = widget
-            logger.debug(f"[STORAGE] Set recording_control_widget for stream: {camera_id}")
+            logger.debug("[STORAGE] Set recording_control_widget for stream: {}", camera_id)
 
             # 이미 연결된 카메라들의 스토리지 콜백 등록
             if stream.gst_pipeline:
@@ -197,7 +195,7 @@ class CameraListWidget(ThemedWidget):
                 widget.register_storage_error_callback(camera_id, callback)
                 logger.info(f"[STORAGE] ✓ Registered storage callback for existing connected camera: {camera_id}")
             else:
-                logger.debug(f"[STORAGE] Camera {camera_id} not yet connected, will register callback on connect")
+                logger.debug("[STORAGE] Camera {} not yet connected, will register callback on connect", camera_id)
 
     def _update_status(self):
         """Update status label and camera items"""
@@ -313,24 +311,41 @@ class CameraListWidget(ThemedWidget):
             # Currently disconnected, so connect
             self._connect_camera()
 
-    def _connect_camera(self):
-        """Connect selected camera"""
-        current_item = self.list_widget.currentItem()
-        if not current_item:
-            return
+    def _find_channel(self, camera_id: str):
+        """
+        카메라가 할당된 grid_view 채널 조회
+
+        GridView의 카메라 ID → 채널 캐시를 사용하여 채널 목록 선형 탐색을 피함
+
+        Args:
+            camera_id: 카메라 ID
+
+        Returns:
+            ChannelWidget 또는 None
+        """
+        if not self.main_window or not hasattr(self.main_window, 'grid_view'):
+            return None
+        return self.main_window.grid_view.channel_for_camera(camera_id)
+
+    def _connect_camera(self, camera_item=None):
+        """
+        Connect selected camera
+
+        Args:
+            camera_item: 연결할 CameraListItem (None이면 현재 선택된 아이템)
+        """
+        if camera_item is None:
+            camera_item = self.list_widget.currentItem()
+            if not camera_item:
+                return
 
-        camera_item = current_item
         if camera_item.camera_stream and not camera_item.camera_stream.is_connected():
             # 윈도우 핸들 찾기 (main_window의 grid_view에서)
             window_handle = None
-            if self.main_window and hasattr(self.main_window, 'grid_view'):
-                grid_view = self.main_window.grid_view
-                # 해당 카메라 ID를 가진 채널 찾기
-                for channel in grid_view.channels:
-                    if channel.camera_id == camera_item.camera_config.camera_id:
-                        window_handle = channel.get_window_handle()
-                        logger.debug(f"Found window handle for {camera_item.camera_config.camera_id}: {window_handle}")
-                        break
+            channel = self._find_channel(camera_item.camera_config.camera_id)
+            if channel:
+                window_handle = channel.get_window_handle()
+                logger.debug("Found window handle for {}: {}", camera_item.camera_config.camera_id, window_handle)
 
             # 녹화 지원 여부 확인
             enable_recording = camera_item.camera_config.recording_enabled_start
@@ -339,6 +354,9 @@ class CameraListWidget(ThemedWidget):
                 self.camera_connected.emit(camera_item.camera_config.camera_id)
                 camera_item.update_display()
                 self._update_status()
+            elif camera_item.camera_stream.gst_pipeline:
+                # 파이프라인은 생성되어 자동 재연결 중 (재연결 성공은 파이프라인 콜백으로 통지됨)
+                self.camera_reconnecting.emit(camera_item.camera_config.camera_id)
 
     def _disconnect_camera(self):
         """Disconnect selected camera"""
@@ -363,17 +381,17 @@ class CameraListWidget(ThemedWidget):
         else:
             logger.warning("Could not find grid_view from main_window")
 
+        # 카메라별 시그널 대신 연결된 ID를 모아 1회 통지
+        connected_ids = []
         for camera_item in self.camera_items.values():
             if camera_item.camera_config.enabled and camera_item.camera_stream:
                 if not camera_item.camera_stream.is_connected():
                     # 각 카메라에 대한 윈도우 핸들 찾기
                     window_handle = None
-                    if grid_view:
-                        for channel in grid_view.channels:
-                            if channel.camera_id == camera_item.camera_config.camera_id:
-                                window_handle = channel.get_window_handle()
-                                logger.info(f"Assigning window handle to {camera_item.camera_config.camera_id}: {window_handle}")
-                                break
+                    channel = self._find_channel(camera_item.camera_config.camera_id) if grid_view else None
+                    if channel:
+                        window_handle = channel.get_window_handle()
+                        logger.info(f"Assigning window handle to {camera_item.camera_config.camera_id}: {window_handle}")
 
                     if not window_handle:
                         logger.warning(f"No window handle found for {camera_item.camera_config.camera_id}")
@@ -382,18 +400,26 @@ class CameraListWidget(ThemedWidget):
                     enable_recording = camera_item.camera_config.recording_enabled_start
 
                     if camera_item.camera_stream.connect(window_handle=window_handle, enable_recording=enable_recording):
-                        self.camera_connected.emit(camera_item.camera_config.camera_id)
+                        connected_ids.append(camera_item.camera_config.camera_id)
                         logger.success(f"Connected camera: {camera_item.camera_config.camera_id}")
+                    elif camera_item.camera_stream.gst_pipeline:
+                        # 파이프라인은 생성되어 자동 재연결 중 (재연결 성공은 파이프라인 콜백으로 통지됨)
+                        self.camera_reconnecting.emit(camera_item.camera_config.camera_id)
 
+        if connected_ids:
+            self.cameras_connected.emit(connected_ids)
         self._update_status()
 
     def _disconnect_all(self):
         """Disconnect all cameras"""
+        disconnected_ids = []
         for camera_item in self.camera_items.values():
             if camera_item.camera_stream and camera_item.camera_stream.is_connected():
                 camera_item.camera_stream.disconnect()
-                self.camera_disconnected.emit(camera_item.camera_config.camera_id)
+                disconnected_ids.append(camera_item.camera_config.camera_id)
 
+        if disconnected_ids:
+            self.cameras_disconnected.emit(disconnected_ids)
         self._update_status()
 
     def get_camera_stream(self, camera_id: str) -> CameraStream:
@@ -492,11 +518,8 @@ class CameraListWidget(ThemedWidget):
         if self.main_window:
             logger.info("Re-assigning cameras to channels and recording control after config change...")
 
-            # GridView 채널 재할당
-            self.main_window._auto_assign_cameras()
-
-            # RecordingControlWidget 재등록
-            self.main_window._populate_recording_control()
+            # GridView 채널 재할당 + RecordingControlWidget 재등록 (카메라 목록 1회 순회)
+            self.main_window._initialize_cameras()
 
             # 윈도우 핸들 재할당
             self.main_window._assign_window_handles_to_streams()
@@ -11,10 +11,6 @@ from PyQt5.QtCore import Qt, QTimer, pyqtSignal, QRect
 from PyQt5.QtGui import QPainter, QColor, QFont, QCursor, QFontMetrics
 import datetime
 
-# Fix import
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
 from ui.video_widget import StreamVideoWidget
 
 
@@ -32,6 +28,27 @@ class ChannelWidget(StreamVideoWidget):
         self.is_fullscreen = False
         self.show_osd = True
         self.is_recording = False
+        self.camera_map = None  # GridViewWidget의 카메라 ID → 채널 캐시 (할당 변경 시 함께 갱신)
+
+    def update_camera_info(self, camera_id: str, camera_name: str):
+        """
+        Update camera information (그리드의 카메라 ID → 채널 캐시도 함께 갱신)
+
+        Args:
+            camera_id: Camera identifier
+            camera_name: Display name
+        """
+        old_camera_id = self.camera_id
+        super().update_camera_info(camera_id, camera_name)
+
+        camera_map = self.camera_map
+        if camera_map is None:
+            return
+        if camera_map.get(old_camera_id) is self:
+            del camera_map[old_camera_id]
+        # 다른 채널이 이미 같은 카메라를 가지고 있으면 먼저 나오는 채널 우선 (기존 선형 탐색과 동일)
+        if camera_id and camera_id not in camera_map:
+            camera_map[camera_id] = self
 
     def mouseDoubleClickEvent(self, event):
         """Handle double-click for fullscreen"""
@@ -87,6 +104,26 @@ class ChannelWidget(StreamVideoWidget):
         self.show_osd = not self.show_osd
         self.update()
 
+    def reset(self, camera_id: str = "", camera_name: str = "No Camera"):
+        """
+        카메라 할당 해제 (카메라 정보 + 연결 상태를 한 번의 repaint로 갱신)
+
+        해제 중에는 stream_disconnected 시그널을 보내지 않음
+        (이미 비워진 camera_id로 발생하므로 의미 없는 시그널 디스패치)
+
+        Args:
+            camera_id: 해제 후 표시할 카메라 ID
+            camera_name: 해제 후 표시할 이름
+        """
+        self.setUpdatesEnabled(False)
+        was_blocked = self.blockSignals(True)
+        try:
+            self.update_camera_info(camera_id, camera_name)
+            self.set_connected(False)
+        finally:
+            self.blockSignals(was_blocked)
+            self.setUpdatesEnabled(True)
+
     def set_recording(self, recording: bool):
         """Set recording state - delegated to parent StreamVideoWidget"""
         self.is_recording = recording
@@ -109,7 +146,8 @@ class GridViewWidget(QWidget):
 
     def __init__(self, parent=None):
         super().__init__(parent)
-        self.channels = []
+        self.channels = ()  # 생성된 채널 위젯 (레이아웃 확장 시에만 늘어나므로 tuple로 유지)
+        self._channel_by_camera = {}  # 카메라 ID → 채널 위젯 캐시
         self.current_layout = None  # Initialize as None to force initial layout
         self.fullscreen_channel = None
         self.selected_channel = None
@@ -186,7 +224,8 @@ class GridViewWidget(QWidget):
             btn.setSizePolicy(QSizePolicy.Preferred, QSizePolicy.Fixed)
 
             btn.setCheckable(True)
-            btn.clicked.connect(lambda checked, size=layout_size: self.set_layout(*size))
+            btn.setProperty("layout_size", layout_size)
+            btn.clicked.connect(self._on_layout_button_clicked)
             layout.addWidget(btn, 0, Qt.AlignVCenter)
             self.layout_buttons[layout_size] = btn
 
@@ -261,6 +300,14 @@ class GridViewWidget(QWidget):
         #     if channel.show_osd:
         #         channel.update()
 
+    def _on_layout_button_clicked(self):
+        """레이아웃 버튼 공통 슬롯 (버튼 속성에 저장된 (rows, cols) 사용)"""
+        button = self.sender()
+        if button is None:
+            return
+        rows, cols = button.property("layout_size")
+        self.set_layout(rows, cols)
+
     def set_layout(self, rows: int, cols: int):
         """
         Set grid layout with widget reuse for uninterrupted streaming
@@ -290,6 +337,7 @@ class GridViewWidget(QWidget):
         # 채널이 부족하면 추가 생성
         if needed_channels > current_channels:
             logger.info(f"Creating {needed_channels - current_channels} additional channels")
+            new_channels = []
             for i in range(current_channels, needed_channels):
                 channel = ChannelWidget(
                     i,
@@ -299,7 +347,11 @@ class GridViewWidget(QWidget):
                 # Connect signals
                 channel.double_clicked.connect(self._on_channel_double_clicked)
                 channel.right_clicked.connect(self._on_channel_right_clicked)
-                self.channels.append(channel)
+                # 카메라 ID → 채널 캐시 연결 및 기본 ID 등록
+                channel.camera_map = self._channel_by_camera
+                self._channel_by_camera.setdefault(channel.camera_id, channel)
+                new_channels.append(channel)
+            self.channels += tuple(new_channels)
 
         # 채널이 초과하면 숨김 처리 (삭제하지 않음)
         elif needed_channels < current_channels:
@@ -464,12 +516,37 @@ class GridViewWidget(QWidget):
         Args:
             camera_id: Camera ID to remove
         """
+        channel = self.channel_for_camera(camera_id)
+        if channel:
+            # Reset to default
+            channel.reset(f"cam_{channel.channel_index}", f"Camera {channel.channel_index + 1}")
+
+    def rebuild_camera_map(self):
+        """
+        채널 목록으로 카메라 ID → 채널 캐시 재구성 (일괄 할당 변경 후 호출)
+
+        채널 위젯이 같은 dict를 참조하므로 새 dict를 만들지 않고 제자리에서 갱신
+        """
+        channel_map = self._channel_by_camera
+        channel_map.clear()
         for channel in self.channels:
-            if channel.camera_id == camera_id:
-                # Reset to default
-                channel.update_camera_info(f"cam_{channel.channel_index}", f"Camera {channel.channel_index + 1}")
-                channel.set_connected(False)
-                break
+            # 선형 탐색과 동일하게 먼저 나오는 채널 우선
+            if channel.camera_id and channel.camera_id not in channel_map:
+                channel_map[channel.camera_id] = channel
+
+    def channel_for_camera(self, camera_id: str):
+        """
+        카메라가 할당된 채널 위젯 조회 (O(1))
+
+        캐시는 ChannelWidget.update_camera_info()에서 갱신되므로 조회만 수행
+
+        Args:
+            camera_id: 카메라 ID
+
+        Returns:
+            ChannelWidget 또는 None (채널에 할당되지 않은 카메라)
+        """
+        return self._channel_by_camera.get(camera_id)
 
     def keyPressEvent(self, event):
         """Handle keyboard shortcuts"""
@@ -3,75 +3,303 @@ Enhanced Main Window with 4-channel grid view
 Integrates camera list, grid view, and configuration management
 """
 
-import sys
+import time
+from collections import deque
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, wait
 from PyQt5.QtWidgets import (
-    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout,
-    QSplitter, QStatusBar, QMenuBar, QMenu, QAction,
+    QMainWindow, QStatusBar, QAction, QActionGroup,
     QMessageBox, QDockWidget, QLabel, QApplication
 )
-from PyQt5.QtCore import Qt, QTimer, pyqtSlot, QDateTime, QEvent
+from PyQt5.QtCore import Qt, QTimer, QThread, QThreadPool, QRunnable, pyqtSignal, pyqtSlot, QEvent
 from PyQt5.QtGui import QKeySequence, QCloseEvent
 from loguru import logger
 
-# Fix imports with full paths
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from ui.grid_view import GridViewWidget
 from ui.camera_list_widget import CameraListWidget
 from ui.recording_control_widget import RecordingControlWidget
 from ui.playback_widget import PlaybackWidget
 from ui.theme import ThemeManager
 from core.config import ConfigManager
+from core.enums import AlertLevel
 from core.storage import StorageService
 from core.system_monitor import SystemMonitorThread
-from camera.streaming import CameraStream
-from camera.playback import PlaybackManager
-from camera.ptz_controller import PTZController
+
+
+# 상태바 문자열 템플릿 (호출 지점에서 % 포맷)
+_CONNECTION_FMT = "%d/%d cameras connected"
+_NO_CONNECTION_TEXT = "No cameras connected"
+_LAYOUT_FMT = "Layout: %dx%d"
+_CPU_FMT = "CPU: %.1f%%"
+_MEMORY_FMT = "Memory: %.1f%%"
+_TEMP_FMT = "Temp: %.1f°C"
+_TEMP_NA_TEXT = "Temp: N/A"
+_DISK_FMT = "Disk: %.1fGB free"
+
+# 시스템 상태 라벨 스타일 (레벨: normal / warning / critical)
+_LEVEL_NORMAL = "normal"
+_LEVEL_WARNING = "warning"
+_LEVEL_CRITICAL = "critical"
+_LEVEL_STYLES = {
+    _LEVEL_NORMAL: "",
+    _LEVEL_WARNING: "color: #ffaa00; font-weight: bold;",
+    _LEVEL_CRITICAL: "color: #ff4444; font-weight: bold;",
+}
+
+# 메뉴/단축키 키 시퀀스 (문자열 파싱 없이 키 코드로 1회 정의)
+_KS_QUIT = Qt.CTRL + Qt.Key_Q
+_KS_FULLSCREEN = Qt.Key_F11
+_KS_CONNECT_ALL = Qt.CTRL + Qt.SHIFT + Qt.Key_C
+_KS_DISCONNECT_ALL = Qt.CTRL + Qt.SHIFT + Qt.Key_D
+_KS_SEQUENCE = Qt.CTRL + Qt.Key_S
+_KS_SETTINGS = Qt.CTRL + Qt.Key_Comma
+_KS_LOG_SEARCH = Qt.CTRL + Qt.Key_L
+_KS_REFRESH = Qt.Key_F5
+
+# PTZ 액션별 상태바 메시지 (%d: PTZ 속도)
+_PTZ_MESSAGES = {
+    'zoom_in': "PTZ: Zoom In (Speed: %d)",
+    'zoom_out': "PTZ: Zoom Out (Speed: %d)",
+    'up': "PTZ: Up",
+    'down': "PTZ: Down",
+    'left': "PTZ: Left",
+    'right': "PTZ: Right",
+    'pan_left': "PTZ: Up-Left",
+    'right_up': "PTZ: Up-Right",
+    'pan_down': "PTZ: Down-Left",
+    'right_down': "PTZ: Down-Right",
+    'stop': "PTZ: Stop",
+}
+# 키를 누를 때 실행할 PTZ 명령 (action -> handler(controller, speed))
+_PTZ_PRESS_HANDLERS = {
+    'zoom_in': lambda ptz, speed: ptz.zoom_in(speed),
+    'zoom_out': lambda ptz, speed: ptz.zoom_out(speed),
+    'up': lambda ptz, speed: ptz.move_up(speed),
+    'down': lambda ptz, speed: ptz.move_down(speed),
+    'left': lambda ptz, speed: ptz.move_left(speed),
+    'right': lambda ptz, speed: ptz.move_right(speed),
+    'pan_left': lambda ptz, speed: ptz.send_command("UPLEFT", speed),
+    'right_up': lambda ptz, speed: ptz.send_command("UPRIGHT", speed),
+    'pan_down': lambda ptz, speed: ptz.send_command("DOWNLEFT", speed),
+    'right_down': lambda ptz, speed: ptz.send_command("DOWNRIGHT", speed),
+    'stop': lambda ptz, speed: ptz.stop(),
+}
+_PTZ_ZOOM_ACTIONS = frozenset(('zoom_in', 'zoom_out'))
+_PTZ_MOVE_ACTIONS = frozenset((
+    'pan_left', 'up', 'right_up', 'left', 'right', 'pan_down', 'down', 'right_down'
+))
+_PTZ_SPEED_FMT = "PTZ Speed: %d/9"
+_PTZ_STATUS_MIN_INTERVAL = 0.2  # 같은 PTZ 메시지 상태바 갱신 최소 간격 (초)
+
+# 연결 직후 자동 녹화 시작까지 대기 시간 (초) - 파이프라인 안정화 대기
+_AUTO_RECORD_DELAY = 0.5
+
+# 창 이동/크기 조절 후 UI 상태 저장까지 대기 시간 (ms) - 드래그 중 연속 저장을 1회로 병합
+_UI_SAVE_DEBOUNCE_MS = 500
+
+# 키 이벤트 → menu_keys 설정 문자열 변환 테이블
+_SPECIAL_KEYS = {
+    Qt.Key_Escape: "Esc",
+    Qt.Key_Return: "Enter",
+    Qt.Key_Enter: "Enter",
+    Qt.Key_Tab: "Tab",
+    Qt.Key_Backspace: "Backspace",
+    Qt.Key_Delete: "Delete",
+    Qt.Key_Home: "Home",
+    Qt.Key_End: "End",
+    Qt.Key_PageUp: "PageUp",
+    Qt.Key_PageDown: "PageDown",
+    Qt.Key_Up: "Up",
+    Qt.Key_Down: "Down",
+    Qt.Key_Left: "Left",
+    Qt.Key_Right: "Right",
+    Qt.Key_Space: "Space",
+}
+# F1-F12 (Qt 키 코드는 연속 값)
+_SPECIAL_KEYS.update({Qt.Key_F1 + i: f"F{i + 1}" for i in range(12)})
+
+# 전체화면 자동 숨김에서 사용자 활동으로 간주하는 마우스 이벤트
+_ACTIVITY_EVENT_TYPES = frozenset((
+    QEvent.MouseMove,
+    QEvent.MouseButtonPress,
+    QEvent.MouseButtonRelease,
+))
+
+# View > Layout 메뉴 항목 (표시 이름, (rows, cols))
+_LAYOUT_OPTIONS = (("1x1", (1, 1)), ("2x2", (2, 2)), ("3x3", (3, 3)), ("4x4", (4, 4)))
+
+# About 다이얼로그 본문 (앱 이름/버전만 치환)
+_ABOUT_FMT = (
+    "<b>%s - Network Video Recorder</b><br>"
+    "Version %s<br><br>"
+    "Single Camera View<br>"
+    "Built with GStreamer and PyQt5<br><br>"
+    "Optimized for single camera recording"
+)
+
+# Dock 공통 기능 플래그 (카메라/녹화/재생 Dock)
+_DOCK_FEATURES = (
+    QDockWidget.DockWidgetMovable |
+    QDockWidget.DockWidgetFloatable |
+    QDockWidget.DockWidgetClosable
+)
+
+# 단축키 도움말 (Help > Keyboard Shortcuts)
+_SHORTCUTS_HTML = """
+<b>Keyboard Shortcuts:</b><br><br>
+<b>General:</b><br>
+Ctrl+Q - Exit<br>
+F11 - Toggle Fullscreen<br><br>
+
+<b>View:</b><br>
+F11 - Toggle Fullscreen<br>
+F - Toggle Fullscreen<br>
+ESC - Exit Fullscreen<br><br>
+
+<b>Camera Control:</b><br>
+Ctrl+Shift+C - Connect Camera<br>
+Ctrl+Shift+D - Disconnect Camera<br><br>
+
+<b>Playback:</b><br>
+F5 - Refresh Recordings<br>
+Space - Play/Pause (in playback)<br>
+"""
+
+
+class AutoCleanupThread(QThread):
+    """녹화 파일 자동 정리 스레드 (파일 stat/삭제를 GUI 스레드 밖에서 실행)"""
+    cleanup_completed = pyqtSignal(int)  # 삭제된 파일 수
+    cleanup_failed = pyqtSignal(str)  # 에러 메시지
+
+    def __init__(self, storage_service: StorageService):
+        super().__init__()
+        self.storage_service = storage_service
+
+    def run(self):
+        """정리 실행"""
+        try:
+            # 종료 시 requestInterruption()이 호출되면 다음 삭제 전에 중단
+            deleted_count = self.storage_service.auto_cleanup(should_stop=self.isInterruptionRequested)
+            self.cleanup_completed.emit(deleted_count)
+        except Exception as e:
+            self.cleanup_failed.emit(str(e))
+
+
+class UiConfigSaveRunnable(QRunnable):
+    """UI 설정 DB 저장 작업 (QThreadPool에서 실행, 인스턴스 1개를 재사용)"""
+
+    def __init__(self, config_manager: ConfigManager):
+        super().__init__()
+        self.config_manager = config_manager
+        self.setAutoDelete(False)
+
+    def run(self):
+        """UI 설정 저장 실행"""
+        self.config_manager.save_ui_config()
 
 
 class MainWindow(QMainWindow):
     """Main application window with camera grid view"""
 
+    # 파이프라인(GLib 스레드)에서 발생한 상태 변경을 GUI 스레드로 전달 (queued)
+    connection_state_changed = pyqtSignal(str, bool)  # camera_id, is_connected
+    recording_state_changed = pyqtSignal(str, bool)  # camera_id, is_recording
+
     def __init__(self):
         super().__init__()
         # Get singleton instance
         self.config_manager = ConfigManager.get_instance()
-        self.playback_manager = PlaybackManager()
 
         # Initialize theme manager
         self.theme_manager = ThemeManager()
         self.theme_manager.theme_changed.connect(self._on_theme_changed)
+        self._applied_theme = None  # 마지막으로 스타일시트를 적용한 테마
 
         # Initialize core services
         self.storage_service = StorageService()
+        self.cleanup_thread = None  # 자동 정리 스레드 (실행 중에는 중복 실행 방지)
 
         self.grid_view = None
         self.camera_list = None
         self.recording_control = None
         self.playback_widget = None
+        self.playback_dock = None
         self.is_playback_mode = False
 
+        # 상태 동기화용 메뉴 액션 (_setup_menus에서 생성)
+        self.fullscreen_action = None
+        self.camera_dock_action = None
+        self.recording_dock_action = None
+        self.playback_dock_action = None
+        self.layout_actions = {}  # (rows, cols) → QAction (Layout 메뉴 최초 표시 시 생성)
+
         # Get app name and version from config
         self.app_name = self.config_manager.app_config.app_name
         self.app_version = self.config_manager.app_config.version
         self.app_display_name = f"{self.app_name}/{self.app_version}"
 
         self.monitor_thread = None
+        self.clock_timer = None
+        self.cleanup_timer = None
 
         # 전체화면 자동 UI 숨김/표시 기능 관련 변수
         self.ui_hide_timer = None
         self.ui_hidden = False
-        self.last_activity_time = QDateTime.currentDateTime()
+        self._last_activity_ts = time.monotonic()  # 마지막 사용자 활동 시각 (monotonic 초)
+        self._auto_hide_delay = 0  # 자동 숨김 지연 시간 (초, 설정값 캐시)
 
         # PTZ 제어 관련 변수
         self.ptz_controller = None
         self.ptz_speed = 5  # 기본 PTZ 속도 (1-9)
+        self._ptz_controllers = {}  # camera_id → PTZController 캐시 (선택/연결마다 재생성하지 않음)
+        self._last_ptz_status = (None, 0.0)  # (마지막 PTZ 상태바 메시지, 표시 시각)
         self.ptz_keys = {}  # PTZ 키 설정
+        self._ptz_key_to_action = {}  # 대문자 키 문자열 → PTZ 액션 (역방향 조회용)
 
         # 메뉴 키 설정
         self.menu_keys = {}  # 메뉴 단축키 설정
+        self._menu_key_to_action = {}  # 대문자 키 문자열 → 메뉴 액션 (역방향 조회용)
+        self._menu_action_table = {}  # 메뉴 액션 → 처리 함수 (UI 생성 후 구성)
+
+        # 단축키 도움말 다이얼로그 (최초 표시 시 1회 생성 후 재사용)
+        self._shortcuts_dialog = None
+
+        # 연결된 카메라 ID 집합 (연결/해제 이벤트로 갱신, 상태바 카운트용)
+        self._connected_cameras = set()
+        self._last_conn_stats = (-1, -1)  # 마지막으로 표시한 (connected, total)
+
+        # 파이프라인 상태 변경 병합 (연속 콜백을 10ms 후 카메라별 최신 상태로 1회 반영)
+        self._pending_connection_states = {}  # camera_id → is_connected
+        self._pending_recording_states = {}  # camera_id → is_recording
+        self._state_flush_timer = QTimer(self)
+        self._state_flush_timer.setSingleShot(True)
+        self._state_flush_timer.timeout.connect(self._flush_pipeline_states)
+
+        # 자동 녹화 예약 큐 (deadline, camera_id) - 카메라별 singleShot 대신 타이머 1개로 처리
+        self._pending_auto_record = deque()
+        self._auto_record_timer = QTimer(self)
+        self._auto_record_timer.setSingleShot(True)
+        self._auto_record_timer.timeout.connect(self._drain_auto_record)
+
+        # 채널 할당/스트림 구성이 바뀌어 스트림 윈도우 핸들 재할당이 필요한지 여부
+        self._channel_assignment_dirty = True
+
+        # 활성 카메라 목록 캐시 (카메라 추가/삭제/수정, 설정 변경 시 무효화)
+        self._enabled_cameras_cache = None
+
+        # Dock visibility → 메뉴 체크 동기화 예약 여부 (연속 시그널을 1회로 병합)
+        self._dock_sync_pending = False
+
+        # 창 크기 조절 중 연속 resizeEvent를 마지막 1회의 재생 Dock 크기 조정으로 병합
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.timeout.connect(self._update_playback_dock_size)
+
+        # 창 이동/크기 조절 시 UI 상태 저장 (500ms 트레일링 디바운스 후 백그라운드 쓰기)
+        self._save_timer = QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(self._save_ui_state_in_background)
+        self._save_runnable = UiConfigSaveRunnable(self.config_manager)
 
         self._setup_ui()
         self._setup_menus()
@@ -79,6 +307,7 @@ class MainWindow(QMainWindow):
         self._load_dock_state()  # Dock 상태를 먼저 로드
         self._load_ptz_keys()  # PTZ 키 설정 로드
         self._load_menu_keys()  # 메뉴 키 설정 로드
+        self._menu_action_table = self._build_menu_action_table()
         self._setup_connections()  # 그 다음 시그널 연결
         self._setup_cleanup_timer()  # 자동 정리 타이머 설정
         self._setup_fullscreen_auto_hide()  # 전체화면 자동 UI 숨김 설정
@@ -92,7 +321,7 @@ class MainWindow(QMainWindow):
         logger.info("Enhanced main window initialized")
 
     def _setup_ui(self):
-        """Setup main UI with splitter layout"""
+        """Setup main UI (grid view as central widget, panels as docks)"""
         self.setWindowTitle(f"{self.app_display_name} - Network Video Recorder (Single Camera)")
 
         # 최소 화면 크기 설정 (800x480)
@@ -113,32 +342,15 @@ class MainWindow(QMainWindow):
                             ws.get('width', 1200), ws.get('height', 700))
             logger.info(f"Starting with window state: x={ws.get('x', 100)}, y={ws.get('y', 100)}, w={ws.get('width', 1200)}, h={ws.get('height', 700)}")
 
-        # Central widget with splitter
-        central_widget = QWidget()
-        main_layout = QHBoxLayout()
-        main_layout.setContentsMargins(0, 0, 0, 0)
-        main_layout.setSpacing(0)
-
-        # Create splitter for resizable panels
-        splitter = QSplitter(Qt.Horizontal)
-
         # Left panel - Camera list (as dock widget)
         self.camera_dock = QDockWidget("Cameras", self)
         self.camera_dock.setObjectName("camera_dock")  # 객체 이름 설정 (저장/복원에 필요)
-        self.camera_dock.setFeatures(
-            QDockWidget.DockWidgetMovable |
-            QDockWidget.DockWidgetFloatable |
-            QDockWidget.DockWidgetClosable
-        )
+        self.camera_dock.setFeatures(_DOCK_FEATURES)
         # Right panel - Recording control (as dock widget)
         # ⭐ 중요: RecordingControlWidget을 먼저 생성 (CameraListWidget에서 참조)
         self.recording_dock = QDockWidget("Recording Control", self)
         self.recording_dock.setObjectName("recording_dock")  # 객체 이름 설정
-        self.recording_dock.setFeatures(
-            QDockWidget.DockWidgetMovable |
-            QDockWidget.DockWidgetFloatable |
-            QDockWidget.DockWidgetClosable
-        )
+        self.recording_dock.setFeatures(_DOCK_FEATURES)
         self.recording_control = RecordingControlWidget()
         self.recording_control.main_window = self  # MainWindow 참조 설정
         self.recording_dock.setWidget(self.recording_control)
@@ -155,11 +367,7 @@ class MainWindow(QMainWindow):
         # Bottom panel - Playback widget (as dock widget)
         self.playback_dock = QDockWidget("Playback", self)
         self.playback_dock.setObjectName("playback_dock")  # 객체 이름 설정
-        self.playback_dock.setFeatures(
-            QDockWidget.DockWidgetMovable |
-            QDockWidget.DockWidgetFloatable |
-            QDockWidget.DockWidgetClosable
-        )
+        self.playback_dock.setFeatures(_DOCK_FEATURES)
         self.playback_widget = PlaybackWidget()
         self.playback_dock.setWidget(self.playback_widget)
         self.addDockWidget(Qt.BottomDockWidgetArea, self.playback_dock)
@@ -167,13 +375,9 @@ class MainWindow(QMainWindow):
         # Set initial playback dock height to 30% of window height
         self._update_playback_dock_size()
 
-        # Main area - Grid view
+        # Main area - Grid view (Dock 외 영역은 grid_view 하나뿐이므로 중간 컨테이너 없이 central widget으로 사용)
         self.grid_view = GridViewWidget()
-        splitter.addWidget(self.grid_view)
-
-        main_layout.addWidget(splitter)
-        central_widget.setLayout(main_layout)
-        self.setCentralWidget(central_widget)
+        self.setCentralWidget(self.grid_view)
 
         # Apply theme from config
         self._apply_theme()
@@ -183,145 +387,178 @@ class MainWindow(QMainWindow):
         self.grid_view.set_layout(rows, cols)
         logger.info(f"Set initial grid layout to {rows}x{cols} from config")
 
-        # Set initial menu check state (will be done after menus are created)
-        self.initial_layout = (rows, cols)
-
     def _apply_theme(self):
         """Apply theme based on UI configuration"""
         ui_config = self.config_manager.ui_config
         theme = ui_config.theme if ui_config.theme in ['dark', 'light'] else 'dark'
 
         # Set theme in ThemeManager (force_update=True for initial setup)
+        # theme_changed 시그널 → _on_theme_changed에서 스타일시트 적용
         self.theme_manager.set_theme(theme, force_update=True)
 
-        # Apply stylesheet to entire application (not just main window)
         app = QApplication.instance()
-        if app:
-            stylesheet = self.theme_manager.get_application_stylesheet()
-            app.setStyleSheet(stylesheet)
-            logger.info(f"Applied theme to application: {theme}")
-        else:
+        if not app:
             logger.warning("QApplication instance not found - applying theme to main window only")
-            self.setStyleSheet(self.theme_manager.get_application_stylesheet())
+
+    def _set_application_stylesheet(self) -> bool:
+        """
+        애플리케이션 전체에 스타일시트 적용
+
+        main.py에서 시작 시 이미 적용된 경우처럼 동일한 스타일시트이면
+        setStyleSheet()를 호출하지 않음 (QSS 재파싱 및 전체 위젯 re-polish 방지)
+
+        Returns:
+            bool: 스타일시트가 실제로 적용되었으면 True
+        """
+        stylesheet = self.theme_manager.get_application_stylesheet()
+        app = QApplication.instance()
+        target = app if app else self
+
+        if target.styleSheet() == stylesheet:
+            return False
+
+        target.setStyleSheet(stylesheet)
+        return True
 
     def _on_theme_changed(self, theme: str):
         """Handle theme changed signal from ThemeManager"""
-        app = QApplication.instance()
-        if app:
-            app.setStyleSheet(self.theme_manager.get_application_stylesheet())
+        # 설정 저장 등으로 같은 테마가 다시 emit된 경우 (force_update) 스타일시트 비교도 생략
+        if theme == self._applied_theme:
+            return
+        self._applied_theme = theme
+
+        if self._set_application_stylesheet():
             logger.info(f"Theme changed to: {theme}")
         else:
-            self.setStyleSheet(self.theme_manager.get_application_stylesheet())
+            logger.debug(f"Theme stylesheet already applied: {theme}")
 
     def _setup_menus(self):
         """Setup menu bar"""
         menubar = self.menuBar()
 
-        # File menu
-        file_menu = menubar.addMenu("File")
+        # 메뉴 정의 테이블: (label, shortcut, slot, checkable) / None = separator
+        # 상태 동기화에 쓰는 액션은 반환값에서 꺼내 속성으로 보관
 
-        exit_action = QAction("Exit", self)
-        exit_action.setShortcut(QKeySequence("Ctrl+Q"))
-        exit_action.triggered.connect(self.close)
-        file_menu.addAction(exit_action)
+        # File menu
+        self._add_menu_actions(menubar.addMenu("File"), (
+            ("Exit", _KS_QUIT, self.close, False),
+        ))
 
         # View menu
         view_menu = menubar.addMenu("View")
+        (self.fullscreen_action,) = self._add_menu_actions(view_menu, (
+            ("Fullscreen", _KS_FULLSCREEN, self.toggle_fullscreen, True),
+        ))
 
-        self.fullscreen_action = QAction("Fullscreen", self)
-        self.fullscreen_action.setShortcut(QKeySequence("F11"))
-        self.fullscreen_action.setCheckable(True)
-        self.fullscreen_action.triggered.connect(self.toggle_fullscreen)
-        view_menu.addAction(self.fullscreen_action)
-
-        # Layout submenu
+        # Layout submenu (단축키가 없으므로 처음 열릴 때 액션 생성)
         layout_menu = view_menu.addMenu("Layout")
-
-        # Layout action group (radio button behavior)
-        from PyQt5.QtWidgets import QActionGroup
-        self.layout_group = QActionGroup(self)
-
-        # Add layout options
-        self.layout_actions = {}
-        for layout_name, layout_size in [("1x1", (1, 1)), ("2x2", (2, 2)),
-                                         ("3x3", (3, 3)), ("4x4", (4, 4))]:
-            action = QAction(layout_name, self)
-            action.setCheckable(True)
-            action.triggered.connect(lambda checked, size=layout_size: self.grid_view.set_layout(*size))
-            self.layout_group.addAction(action)
-            layout_menu.addAction(action)
-            self.layout_actions[layout_size] = action
-
-        view_menu.addSeparator()
+        layout_menu.aboutToShow.connect(self._populate_layout_menu)
 
         # Dock visibility
-        self.camera_dock_action = QAction("Show Camera List", self)
-        self.camera_dock_action.setCheckable(True)
-        self.camera_dock_action.triggered.connect(self._toggle_camera_dock)
-        view_menu.addAction(self.camera_dock_action)
-
-        self.recording_dock_action = QAction("Show Recording Control", self)
-        self.recording_dock_action.setCheckable(True)
-        self.recording_dock_action.triggered.connect(self._toggle_recording_dock)
-        view_menu.addAction(self.recording_dock_action)
-
-        self.playback_dock_action = QAction("Show Playback", self)
-        self.playback_dock_action.setCheckable(True)
-        self.playback_dock_action.triggered.connect(self._toggle_playback_dock)
-        view_menu.addAction(self.playback_dock_action)
+        (
+            self.camera_dock_action,
+            self.recording_dock_action,
+            self.playback_dock_action,
+        ) = self._add_menu_actions(view_menu, (
+            None,
+            ("Show Camera List", None, self._toggle_camera_dock, True),
+            ("Show Recording Control", None, self._toggle_recording_dock, True),
+            ("Show Playback", None, self._toggle_playback_dock, True),
+        ))
 
         # Camera menu
-        camera_menu = menubar.addMenu("Camera")
-
-        connect_all_action = QAction("Connect All", self)
-        connect_all_action.setShortcut(QKeySequence("Ctrl+Shift+C"))
-        connect_all_action.triggered.connect(self._connect_all_cameras)
-        camera_menu.addAction(connect_all_action)
+        self._add_menu_actions(menubar.addMenu("Camera"), (
+            ("Connect All", _KS_CONNECT_ALL, self._connect_all_cameras, False),
+            ("Disconnect All", _KS_DISCONNECT_ALL, self._disconnect_all_cameras, False),
+            None,
+            ("Start Sequence", _KS_SEQUENCE, self.grid_view.toggle_sequence, False),
+        ))
 
-        disconnect_all_action = QAction("Disconnect All", self)
-        disconnect_all_action.setShortcut(QKeySequence("Ctrl+Shift+D"))
-        disconnect_all_action.triggered.connect(self._disconnect_all_cameras)
-        camera_menu.addAction(disconnect_all_action)
-
-        camera_menu.addSeparator()
+        # Setting menu
+        self._add_menu_actions(menubar.addMenu("Setting"), (
+            ("Settings...", _KS_SETTINGS, self._show_settings_dialog, False),
+        ))
 
-        sequence_action = QAction("Start Sequence", self)
-        sequence_action.setShortcut(QKeySequence("Ctrl+S"))
-        sequence_action.triggered.connect(self.grid_view.toggle_sequence)
-        camera_menu.addAction(sequence_action)
+        # Logs menu
+        self._add_menu_actions(menubar.addMenu("Logs"), (
+            ("Log Search...", _KS_LOG_SEARCH, self._show_log_viewer, False),
+        ))
 
-        # Setting menu
-        setting_menu = menubar.addMenu("Setting")
+        # Help menu (단축키가 없는 액션뿐이므로 처음 열릴 때 생성)
+        help_menu = menubar.addMenu("Help")
+        help_menu.aboutToShow.connect(self._populate_help_menu)
 
-        settings_action = QAction("Settings...", self)
-        settings_action.setShortcut(QKeySequence("Ctrl+,"))
-        settings_action.triggered.connect(self._show_settings_dialog)
-        setting_menu.addAction(settings_action)
+    @pyqtSlot()
+    def _populate_layout_menu(self):
+        """Layout 서브메뉴 최초 표시 시 액션 생성 (현재 레이아웃을 체크 상태로 설정)"""
+        menu = self.sender()
+        if menu is None:
+            return
+        menu.aboutToShow.disconnect(self._populate_layout_menu)
 
-        # Logs menu
-        logs_menu = menubar.addMenu("Logs")
+        # Layout action group (radio button behavior)
+        layout_group = QActionGroup(self)
+        current_layout = self.grid_view.current_layout
+        for layout_name, layout_size in _LAYOUT_OPTIONS:
+            action = QAction(layout_name, self)
+            action.setCheckable(True)
+            action.setChecked(layout_size == current_layout)
+            action.setData(layout_size)
+            action.triggered.connect(self._on_layout_action_triggered)
+            layout_group.addAction(action)
+            menu.addAction(action)
+            self.layout_actions[layout_size] = action
+        logger.debug("Layout menu built (current layout {})", current_layout)
 
-        log_search_action = QAction("Log Search...", self)
-        log_search_action.setShortcut(QKeySequence("Ctrl+L"))
-        log_search_action.triggered.connect(self._show_log_viewer)
-        logs_menu.addAction(log_search_action)
+    @pyqtSlot()
+    def _populate_help_menu(self):
+        """Help 메뉴 최초 표시 시 액션 생성 (이후에는 재사용)"""
+        menu = self.sender()
+        if menu is None:
+            return
+        menu.aboutToShow.disconnect(self._populate_help_menu)
+        self._add_menu_actions(menu, (
+            ("Keyboard Shortcuts", None, self._show_shortcuts, False),
+            ("About", None, self._show_about, False),
+        ))
 
-        # Help menu
-        help_menu = menubar.addMenu("Help")
+    def _add_menu_actions(self, menu, spec):
+        """
+        메뉴 정의 테이블로 QAction 생성 및 메뉴에 추가
 
-        shortcuts_action = QAction("Keyboard Shortcuts", self)
-        shortcuts_action.triggered.connect(self._show_shortcuts)
-        help_menu.addAction(shortcuts_action)
+        Args:
+            menu: 액션을 추가할 QMenu
+            spec: (label, shortcut, slot, checkable) 튜플 목록 (None이면 구분선)
 
-        about_action = QAction("About", self)
-        about_action.triggered.connect(self._show_about)
-        help_menu.addAction(about_action)
+        Returns:
+            list: 생성된 QAction 목록 (구분선 제외, spec 순서)
+        """
+        actions = []
+        for entry in spec:
+            if entry is None:
+                menu.addSeparator()
+                continue
 
-        # Set initial layout menu check state
-        if hasattr(self, 'initial_layout') and hasattr(self, 'layout_actions'):
-            for size, action in self.layout_actions.items():
-                action.setChecked(size == self.initial_layout)
-            logger.debug(f"Set initial layout menu check for {self.initial_layout}")
+            label, shortcut, slot, checkable = entry
+            action = QAction(label, self)
+            if shortcut:
+                action.setShortcut(QKeySequence(shortcut))
+            if checkable:
+                action.setCheckable(True)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+            actions.append(action)
+
+        return actions
+
+    @pyqtSlot()
+    def _on_layout_action_triggered(self):
+        """Layout 메뉴 액션 공통 슬롯 (QAction.data()에 저장된 (rows, cols) 사용)"""
+        action = self.sender()
+        if action is None:
+            return
+        rows, cols = action.data()
+        self.grid_view.set_layout(rows, cols)
 
     def _setup_connections(self):
         """Setup signal connections between components"""
@@ -329,8 +566,16 @@ class MainWindow(QMainWindow):
         self.camera_list.camera_selected.connect(self._on_camera_selected)
         self.camera_list.camera_added.connect(self._on_camera_added)
         self.camera_list.camera_removed.connect(self._on_camera_removed)
+        self.camera_list.camera_updated.connect(self._on_camera_updated)
         self.camera_list.camera_connected.connect(self._on_camera_connected)
         self.camera_list.camera_disconnected.connect(self._on_camera_disconnected)
+        self.camera_list.cameras_connected.connect(self._on_cameras_connected)
+        self.camera_list.cameras_disconnected.connect(self._on_cameras_disconnected)
+        self.camera_list.camera_reconnecting.connect(self._on_camera_reconnecting)
+
+        # 파이프라인 연결/녹화 상태 변경 → UI 갱신 (queued, GUI 스레드에서 실행)
+        self.connection_state_changed.connect(self._on_connection_state_changed)
+        self.recording_state_changed.connect(self._on_recording_state_changed)
 
         # Grid view signals
         self.grid_view.channel_double_clicked.connect(self._on_channel_double_clicked)
@@ -342,24 +587,28 @@ class MainWindow(QMainWindow):
 
         # F5 키 단축키 설정 (Refresh Recordings)
         refresh_shortcut = QAction(self)
-        refresh_shortcut.setShortcut(QKeySequence("F5"))
+        refresh_shortcut.setShortcut(QKeySequence(_KS_REFRESH))
         refresh_shortcut.triggered.connect(self._refresh_recordings)
         self.addAction(refresh_shortcut)
 
         # Dock visibility 시그널 연결 (Dock이 닫힐 때 메뉴 체크 상태 동기화)
-        self.camera_dock.visibilityChanged.connect(self._on_camera_dock_visibility_changed)
-        self.recording_dock.visibilityChanged.connect(self._on_recording_dock_visibility_changed)
-        self.playback_dock.visibilityChanged.connect(self._on_playback_dock_visibility_changed)
+        self.camera_dock.visibilityChanged.connect(self._on_dock_visibility_changed)
+        self.recording_dock.visibilityChanged.connect(self._on_dock_visibility_changed)
+        self.playback_dock.visibilityChanged.connect(self._on_dock_visibility_changed)
 
-        # Auto-assign cameras to channels first
-        self._auto_assign_cameras()
-        # Then assign window handles to camera streams
-        self._assign_window_handles_to_streams()
-        # Finally populate recording control
-        self._populate_recording_control()
+        # 초기 카메라 할당/연결 중 발생하는 위젯 갱신을 1회 레이아웃/repaint로 묶음
+        self.setUpdatesEnabled(False)
+        try:
+            # Auto-assign cameras to channels + populate recording control (카메라 목록 1회 순회)
+            self._initialize_cameras()
+            # Then assign window handles to camera streams
+            self._assign_window_handles_to_streams()
 
-        # Auto-connect cameras with streaming_enabled_start=true
-        self._auto_connect_cameras()
+            # Auto-connect cameras with streaming_enabled_start=true
+            self._auto_connect_cameras()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
 
     def _setup_cleanup_timer(self):
         """자동 정리 타이머 설정"""
@@ -384,17 +633,35 @@ class MainWindow(QMainWindow):
             logger.info("Cleanup on startup scheduled (30s delay)")
 
     def _run_auto_cleanup(self):
-        """자동 정리 실행"""
-        try:
-            logger.info("Starting auto cleanup...")
-            deleted_count = self.storage_service.auto_cleanup()
+        """자동 정리 실행 (백그라운드 스레드)"""
+        # 이전 정리가 아직 실행 중이면 건너뜀 (cleanup_interval_hours가 짧은 경우)
+        if self.cleanup_thread and self.cleanup_thread.isRunning():
+            logger.info("Auto cleanup already running - skipping")
+            return
 
-            if deleted_count > 0:
-                logger.success(f"Auto cleanup completed: {deleted_count} files deleted")
-            else:
-                logger.info("Auto cleanup: no files to delete")
-        except Exception as e:
-            logger.error(f"Auto cleanup failed: {e}")
+        logger.info("Starting auto cleanup...")
+        self.cleanup_thread = AutoCleanupThread(self.storage_service)
+        self.cleanup_thread.cleanup_completed.connect(self._on_cleanup_completed)
+        self.cleanup_thread.cleanup_failed.connect(self._on_cleanup_failed)
+        self.cleanup_thread.finished.connect(self._on_cleanup_finished)
+        self.cleanup_thread.start()
+
+    def _on_cleanup_completed(self, deleted_count: int):
+        """자동 정리 완료"""
+        if deleted_count > 0:
+            logger.success(f"Auto cleanup completed: {deleted_count} files deleted")
+        else:
+            logger.info("Auto cleanup: no files to delete")
+
+    def _on_cleanup_failed(self, error: str):
+        """자동 정리 실패"""
+        logger.error(f"Auto cleanup failed: {error}")
+
+    def _on_cleanup_finished(self):
+        """정리 스레드 종료 후 정리"""
+        if self.cleanup_thread:
+            self.cleanup_thread.deleteLater()
+            self.cleanup_thread = None
 
     def _setup_fullscreen_auto_hide(self):
         """전체화면 모드에서 UI 자동 숨김/표시 설정"""
@@ -404,11 +671,11 @@ class MainWindow(QMainWindow):
             return
 
         # 마우스 추적 활성화 (마우스 움직임 이벤트를 받기 위해 필수)
-        self.setMouseTracking(True)
-        self.centralWidget().setMouseTracking(True)
-
-        # 모든 자식 위젯에도 마우스 추적 활성화
-        for widget in self.findChildren(QWidget):
+        # 최상위 컨테이너에만 설정 - 자식 위젯 전체(findChildren)에 켜지 않음:
+        # QApplication 이벤트 필터는 최상위 윈도우로 전달되는 마우스 이동 이벤트를 모두 받으므로
+        # 이후에 생성되는 위젯까지 별도 설정 없이 감지됨
+        for widget in (self, self.grid_view,
+                       self.camera_dock, self.recording_dock, self.playback_dock):
             widget.setMouseTracking(True)
 
         # 이벤트 필터를 QApplication에 설치 (모든 위젯의 이벤트 감지)
@@ -421,59 +688,87 @@ class MainWindow(QMainWindow):
             self.installEventFilter(self)
             logger.warning("QApplication not found, installing event filter on MainWindow only")
 
-        # 비활동 체크 타이머 시작
+        # 비활동 체크 타이머 생성 (초 단위 정밀도 불필요 → CoarseTimer로 wakeup 병합 허용)
+        # 전체화면일 때만 동작 - changeEvent에서 시작/정지
         self.ui_hide_timer = QTimer(self)
+        self.ui_hide_timer.setTimerType(Qt.CoarseTimer)
+        self.ui_hide_timer.setInterval(2000)  # 2초마다 체크
         self.ui_hide_timer.timeout.connect(self._check_inactivity)
-        self.ui_hide_timer.start(1000)  # 1초마다 체크
+        if self.isFullScreen():
+            self.ui_hide_timer.start()
 
-        delay = self.config_manager.ui_config.fullscreen_auto_hide_delay_seconds
-        logger.info(f"Fullscreen auto-hide feature initialized (delay: {delay}s)")
+        # 매 틱마다 설정을 읽지 않도록 지연 시간 캐시 (설정 변경 시 갱신)
+        self._auto_hide_delay = int(self.config_manager.ui_config.fullscreen_auto_hide_delay_seconds)
+        logger.info(f"Fullscreen auto-hide feature initialized (delay: {self._auto_hide_delay}s)")
 
     def eventFilter(self, obj, event):
         """이벤트 필터: 마우스 활동 감지 및 키보드 이벤트 가로채기"""
+        event_type = event.type()
+
         # 키보드 이벤트 처리 (모든 모드에서 동작)
-        if event.type() == QEvent.KeyPress:
+        if event_type == QEvent.KeyPress:
             # MainWindow의 keyPressEvent 직접 호출
             self.keyPressEvent(event)
             if event.isAccepted():
                 return True
-        elif event.type() == QEvent.KeyRelease:
+        elif event_type == QEvent.KeyRelease:
             # MainWindow의 keyReleaseEvent 직접 호출
             self.keyReleaseEvent(event)
             if event.isAccepted():
                 return True
 
-        # 전체화면 모드일 때 마우스 활동 감지
-        if self.isFullScreen():
-            # 마우스 이동 또는 클릭만 감지
-            if event.type() in [QEvent.MouseMove, QEvent.MouseButtonPress, QEvent.MouseButtonRelease]:
-                self._on_user_activity()
+        # 전체화면 모드일 때 마우스 활동 감지 (마우스 이동 또는 클릭만, 타입 체크를 먼저 수행)
+        elif event_type in _ACTIVITY_EVENT_TYPES and self.isFullScreen():
+            self._on_user_activity()
 
         return super().eventFilter(obj, event)
 
     def _on_user_activity(self):
         """사용자 활동 감지 시 호출"""
-        self.last_activity_time = QDateTime.currentDateTime()
+        self._last_activity_ts = time.monotonic()
 
         # UI가 숨겨진 상태였다면 다시 표시
         if self.ui_hidden:
             self._show_ui()
 
+    def changeEvent(self, event):
+        """
+        윈도우 상태 변경 처리
+
+        - 최소화 시 1초 시계 타이머 정지, 복원 시 즉시 갱신 후 재시작
+        - 전체화면 진입/해제 시 비활동 체크 타이머 시작/정지
+        """
+        if event.type() == QEvent.WindowStateChange and self.clock_timer is not None:
+            if self.isMinimized():
+                self.clock_timer.stop()
+            elif not self.clock_timer.isActive():
+                self._update_clock()
+                self.clock_timer.start(1000)
+
+        if event.type() == QEvent.WindowStateChange and self.ui_hide_timer is not None:
+            if self.isFullScreen():
+                if not self.ui_hide_timer.isActive():
+                    self._last_activity_ts = time.monotonic()
+                    self.ui_hide_timer.start()
+            else:
+                self.ui_hide_timer.stop()
+                # 전체화면 아닐 때는 UI 표시
+                if self.ui_hidden:
+                    self._show_ui()
+
+        super().changeEvent(event)
+
     def _check_inactivity(self):
-        """비활동 시간 체크 (타이머에서 1초마다 호출)"""
-        # 전체화면 모드가 아니면 무시
-        if not self.isFullScreen():
-            # 전체화면 아닐 때는 UI 표시
-            if self.ui_hidden:
-                self._show_ui()
-            return
+        """
+        비활동 시간 체크 (전체화면에서만 타이머가 2초마다 호출)
 
+        숨김은 설정 지연 후 최대 2초 내 적용
+        """
         # 마지막 활동 이후 경과 시간 계산
-        elapsed_seconds = self.last_activity_time.secsTo(QDateTime.currentDateTime())
+        elapsed_seconds = time.monotonic() - self._last_activity_ts
 
         # 설정된 지연 시간 이상 비활동 시 UI 숨김
-        delay = self.config_manager.ui_config.fullscreen_auto_hide_delay_seconds
-        if elapsed_seconds >= delay and not self.ui_hidden:
+        if elapsed_seconds >= self._auto_hide_delay and not self.ui_hidden:
             self._hide_ui()
 
     def _hide_ui(self):
@@ -483,9 +778,8 @@ class MainWindow(QMainWindow):
         self.recording_dock.hide()
         self.playback_dock.hide()
 
-        # Grid view의 controls_bar도 숨김
-        if self.grid_view and hasattr(self.grid_view, 'controls_bar'):
-            self.grid_view.controls_bar.hide()
+        # Grid view의 controls_bar도 숨김 (GridViewWidget 생성 시 항상 만들어짐)
+        self.grid_view.controls_bar.hide()
 
         self.ui_hidden = True
         logger.debug("UI hidden (fullscreen auto-hide)")
@@ -504,8 +798,7 @@ class MainWindow(QMainWindow):
             self.playback_dock.show()
 
         # Grid view의 controls_bar도 표시
-        if self.grid_view and hasattr(self.grid_view, 'controls_bar'):
-            self.grid_view.controls_bar.show()
+        self.grid_view.controls_bar.show()
 
         self.ui_hidden = False
         logger.debug("UI shown (user activity detected)")
@@ -519,9 +812,9 @@ class MainWindow(QMainWindow):
         self.status_bar.setContentsMargins(10, 0, 10, 0)
 
         # 타이머와 스레드 변수 초기화 (closeEvent에서 참조되므로 항상 필요)
-        self.status_timer = None
         self.clock_timer = None
         self.monitor_thread = None
+        self.connection_label = None
 
         # show_status_bar 설정에 따라 표시/숨김
         ui_config = self.config_manager.ui_config
@@ -534,7 +827,7 @@ class MainWindow(QMainWindow):
         # 메인 테마의 QStatusBar 스타일이 적용되므로 별도 스타일 불필요
 
         # Connection status
-        self.connection_label = QLabel("No cameras connected")
+        self.connection_label = QLabel(_NO_CONNECTION_TEXT)
         self.status_bar.addWidget(self.connection_label)
 
         # Separator
@@ -568,101 +861,208 @@ class MainWindow(QMainWindow):
 
         # 시스템 모니터링 스레드 시작
         self.monitor_thread = SystemMonitorThread(update_interval=5)
+
+        # 라벨 색상 임계값 캐시 (설정 변경 시 _on_settings_changed에서 다시 로드)
+        self._load_status_thresholds()
+
+        # 라벨별 현재 레벨/텍스트 (바뀔 때만 setStyleSheet/setText 호출)
+        self._label_levels = {}
+        self._label_texts = {}
+
         self.monitor_thread.status_updated.connect(self._update_system_status)
         self.monitor_thread.alert_triggered.connect(self._on_system_alert)
         self.monitor_thread.start()
 
         # 시계 업데이트 타이머 (1초마다)
         self.clock_timer = QTimer()
+        self.clock_timer.setTimerType(Qt.CoarseTimer)
         self.clock_timer.timeout.connect(self._update_clock)
         self.clock_timer.start(1000)
 
-        # Connection status update timer
-        self.status_timer = QTimer()
-        self.status_timer.timeout.connect(self._update_status)
-        self.status_timer.start(1000)
+        # Connection status는 폴링 타이머 없이 카메라 연결/해제 이벤트로 갱신
+        # (_on_camera_connected, _on_camera_disconnected, connection_state_changed 시그널)
 
         logger.info("Status bar with system monitoring initialized")
 
+    def _load_status_thresholds(self):
+        """
+        performance 설정에서 상태바 라벨 색상 임계값 로드
+
+        모니터링 틱마다 설정을 조회하지 않도록 캐시하며, Settings에서
+        performance 값이 바뀌면 다시 호출하여 라벨 색상에 즉시 반영
+        """
+        perf_config = self.config_manager.config.get('performance', {})
+        self._max_cpu = perf_config.get('max_cpu_percent', 80)
+        self._max_memory_mb = perf_config.get('max_memory_mb', 2048)
+        self._max_temp = perf_config.get('max_temp', 75)
+
+        # Warning 임계값 (CPU/메모리는 80%, 온도는 90%)
+        self._warning_cpu = self._max_cpu * 0.8
+        self._warning_memory_mb = self._max_memory_mb * 0.8
+        self._warning_temp = self._max_temp * 0.9
+
     def _update_status(self):
-        """Update camera connection status"""
-        # Get connection stats from camera list
-        connected = 0
-        total = 0
+        """Update camera connection status (연결 상태 변경 이벤트에서 호출)"""
+        if self.connection_label is None:
+            return
 
-        for camera_id, camera_item in self.camera_list.camera_items.items():
-            total += 1
-            if camera_item.camera_stream and camera_item.camera_stream.is_connected():
-                connected += 1
+        # 연결 수는 이벤트로 유지되는 집합에서 바로 읽음 (스트림별 is_connected() 호출 없음)
+        connected = len(self._connected_cameras)
+        total = len(self.camera_list.camera_items)
+
+        # 값이 같으면 라벨 갱신(setText → 레이아웃/repaint) 생략
+        stats = (connected, total)
+        if stats == self._last_conn_stats:
+            return
+        self._last_conn_stats = stats
 
         if connected > 0:
-            self.connection_label.setText(f"{connected}/{total} cameras connected")
+            self.connection_label.setText(_CONNECTION_FMT % (connected, total))
         else:
-            self.connection_label.setText("No cameras connected")
+            self.connection_label.setText(_NO_CONNECTION_TEXT)
+
+    def _on_connection_state_changed(self, camera_id: str, is_connected: bool):
+        """파이프라인 연결 상태 변경 (GUI 스레드) - 병합 후 반영 예약"""
+        self._pending_connection_states[camera_id] = is_connected
+        if not self._state_flush_timer.isActive():
+            self._state_flush_timer.start(10)
+
+    def _on_recording_state_changed(self, camera_id: str, is_recording: bool):
+        """파이프라인 녹화 상태 변경 (GUI 스레드) - 병합 후 반영 예약"""
+        self._pending_recording_states[camera_id] = is_recording
+        if not self._state_flush_timer.isActive():
+            self._state_flush_timer.start(10)
+
+    def _flush_pipeline_states(self):
+        """병합된 파이프라인 연결/녹화 상태를 Grid View, Recording Control, 상태바에 반영"""
+        connection_states = self._pending_connection_states
+        recording_states = self._pending_recording_states
+        self._pending_connection_states = {}
+        self._pending_recording_states = {}
+
+        camera_items = self.recording_control.camera_items
+        for cam_id, is_connected in connection_states.items():
+            # Update Grid View
+            channel = self.grid_view.channel_for_camera(cam_id)
+            if channel:
+                channel.set_connected(is_connected)
+                logger.debug("[CONNECTION SYNC] Updated Grid View for {}: connected={}", cam_id, is_connected)
+
+            # Update Recording Control Widget
+            if cam_id in camera_items:
+                camera_items[cam_id].set_connected(is_connected)
+                logger.debug("[CONNECTION SYNC] Updated RecordingStatusItem for {}: connected={}", cam_id, is_connected)
+
+            if is_connected:
+                self._connected_cameras.add(cam_id)
+            else:
+                self._connected_cameras.discard(cam_id)
+
+        for cam_id, is_recording in recording_states.items():
+            # Update Grid View (streaming UI)
+            channel = self.grid_view.channel_for_camera(cam_id)
+            if channel:
+                channel.set_recording(is_recording)
+                logger.debug("[UI SYNC] Updated Grid View for {}: recording={}", cam_id, is_recording)
+
+            # Update Recording Control Widget
+            self.recording_control.update_recording_status(cam_id, is_recording)
+
+            # Emit signal for recording control widget
+            if is_recording:
+                self.recording_control.recording_started.emit(cam_id)
+            else:
+                self.recording_control.recording_stopped.emit(cam_id)
+
+        # 상태바 연결 카운트는 배치당 1회 갱신
+        if connection_states:
+            self._update_status()
+
+    def _resync_connected_cameras(self):
+        """
+        연결 카메라 집합을 실제 스트림 상태로 재구성
+
+        설정 변경 시 CameraListWidget이 시그널 없이 스트림을 해제/삭제할 수 있으므로
+        해당 경로 이후에만 전체 스캔으로 동기화
+        """
+        self._connected_cameras = {
+            camera_id for camera_id, camera_item in self.camera_list.camera_items.items()
+            if camera_item.camera_stream and camera_item.camera_stream.is_connected()
+        }
 
-    def _update_system_status(self, cpu: float, memory: float, temp: float, disk_free: float):
+    def _update_system_status(self, cpu: float, memory: float, memory_mb: float,
+                              temp: float, disk_free: float):
         """
         시스템 상태 업데이트 (모니터링 스레드에서 호출)
 
         Args:
             cpu: CPU 사용률 (%)
             memory: 메모리 사용률 (%)
+            memory_mb: 메모리 사용량 (MB)
             temp: 시스템 온도 (°C)
             disk_free: 남은 디스크 공간 (GB)
         """
-        # Performance config에서 임계값 가져오기
-        perf_config = self.config_manager.config.get('performance', {})
-        max_cpu = perf_config.get('max_cpu_percent', 80)
-        max_memory_mb = perf_config.get('max_memory_mb', 2048)
-        max_temp = perf_config.get('max_temp', 75)
-
-        # 메모리를 MB로 변환 (memory는 퍼센트이므로 실제 MB로 변환)
-        import psutil
-        memory_info = psutil.virtual_memory()
-        memory_mb = memory_info.used / (1024**2)
-
-        # Warning 임계값 (80%)
-        warning_cpu = max_cpu * 0.8
-        warning_memory_mb = max_memory_mb * 0.8
-        warning_temp = max_temp * 0.9
-
-        # CPU 상태 표시
-        if cpu >= max_cpu:
-            self.cpu_label.setStyleSheet("color: #ff4444; font-weight: bold;")  # CRITICAL
-        elif cpu >= warning_cpu:
-            self.cpu_label.setStyleSheet("color: #ffaa00; font-weight: bold;")  # WARNING
-        else:
-            self.cpu_label.setStyleSheet("")  # NORMAL
-        self.cpu_label.setText(f"CPU: {cpu:.1f}%")
-
-        # 메모리 상태 표시
-        if memory_mb >= max_memory_mb:
-            self.memory_label.setStyleSheet("color: #ff4444; font-weight: bold;")  # CRITICAL
-        elif memory_mb >= warning_memory_mb:
-            self.memory_label.setStyleSheet("color: #ffaa00; font-weight: bold;")  # WARNING
-        else:
-            self.memory_label.setStyleSheet("")  # NORMAL
-        self.memory_label.setText(f"Memory: {memory:.1f}%")
-
-        # 온도 표시
-        if temp > 0:
-            if temp >= max_temp:
-                self.temp_label.setStyleSheet("color: #ff4444; font-weight: bold;")  # CRITICAL
-            elif temp >= warning_temp:
-                self.temp_label.setStyleSheet("color: #ffaa00; font-weight: bold;")  # WARNING
+        # 임계값은 _setup_status_bar에서 캐시 (슬롯은 비교 + setText만 수행)
+        max_cpu = self._max_cpu
+        max_memory_mb = self._max_memory_mb
+        max_temp = self._max_temp
+        warning_cpu = self._warning_cpu
+        warning_memory_mb = self._warning_memory_mb
+        warning_temp = self._warning_temp
+
+        # 라벨 4개의 setText/setStyleSheet를 한 번의 상태바 repaint로 묶음
+        self.status_bar.setUpdatesEnabled(False)
+        try:
+            # CPU 상태 표시
+            self._set_label_level(self.cpu_label, self._level(cpu, warning_cpu, max_cpu))
+            self._set_label_text(self.cpu_label, _CPU_FMT % cpu)
+
+            # 메모리 상태 표시
+            self._set_label_level(self.memory_label,
+                                  self._level(memory_mb, warning_memory_mb, max_memory_mb))
+            self._set_label_text(self.memory_label, _MEMORY_FMT % memory)
+
+            # 온도 표시
+            if temp > 0:
+                self._set_label_level(self.temp_label, self._level(temp, warning_temp, max_temp))
+                self._set_label_text(self.temp_label, _TEMP_FMT % temp)
             else:
-                self.temp_label.setStyleSheet("")  # NORMAL
-            self.temp_label.setText(f"Temp: {temp:.1f}°C")
-        else:
-            self.temp_label.setStyleSheet("")
-            self.temp_label.setText("Temp: N/A")
+                self._set_label_level(self.temp_label, _LEVEL_NORMAL)
+                self._set_label_text(self.temp_label, _TEMP_NA_TEXT)
+
+            # 디스크 경고 (10GB 미만)
+            self._set_label_level(self.disk_label,
+                                  _LEVEL_CRITICAL if disk_free < 10 else _LEVEL_NORMAL)
+            self._set_label_text(self.disk_label, _DISK_FMT % disk_free)
+        finally:
+            self.status_bar.setUpdatesEnabled(True)
+
+    @staticmethod
+    def _level(value: float, warning: float, critical: float) -> str:
+        """값에 해당하는 경고 레벨 반환"""
+        if value >= critical:
+            return _LEVEL_CRITICAL
+        if value >= warning:
+            return _LEVEL_WARNING
+        return _LEVEL_NORMAL
+
+    def _set_label_level(self, label: QLabel, level: str):
+        """
+        라벨 경고 레벨 스타일 적용 (레벨이 바뀐 경우에만)
 
-        # 디스크 경고 (10GB 미만)
-        if disk_free < 10:
-            self.disk_label.setStyleSheet("color: #ff4444; font-weight: bold;")
-        else:
-            self.disk_label.setStyleSheet("")
-        self.disk_label.setText(f"Disk: {disk_free:.1f}GB free")
+        setStyleSheet는 QSS 재파싱 + polish를 유발하므로 같은 레벨이면 생략
+        """
+        if self._label_levels.get(label) == level:
+            return
+        self._label_levels[label] = level
+        label.setStyleSheet(_LEVEL_STYLES[level])
+
+    def _set_label_text(self, label: QLabel, text: str):
+        """라벨 텍스트 적용 (이전과 같으면 QString 변환/setText 생략)"""
+        if self._label_texts.get(label) == text:
+            return
+        self._label_texts[label] = text
+        label.setText(text)
 
     def _on_system_alert(self, alert_level: str, message: str):
         """
@@ -672,8 +1072,6 @@ class MainWindow(QMainWindow):
             alert_level: 경고 레벨 ('normal', 'warning', 'critical')
             message: 경고 메시지
         """
-        from core.enums import AlertLevel
-
         # 상태바에 경고 메시지 표시 (5초 동안)
         if alert_level == AlertLevel.CRITICAL.value:
             # Critical 경고는 팝업으로도 표시
@@ -693,60 +1091,60 @@ class MainWindow(QMainWindow):
 
     def _update_clock(self):
         """시계 업데이트"""
-        current_time = QDateTime.currentDateTime().toString("yyyy-MM-dd HH:mm:ss")
-        self.clock_label.setText(f"  {current_time}")
+        # QDateTime/QString 생성 없이 C 레벨 strftime 1회 호출
+        self.clock_label.setText(time.strftime("  %Y-%m-%d %H:%M:%S"))
 
-    def _auto_assign_cameras(self):
-        """Auto-assign cameras from config to grid channels"""
-        # 디버그 로그 추가
-        logger.info(f"ConfigManager cameras list: {self.config_manager.cameras}")
-        logger.info(f"ConfigManager cameras count: {len(self.config_manager.cameras)}")
+    def _enabled_cameras(self):
+        """
+        활성 카메라 목록 (캐시)
 
-        cameras = self.config_manager.get_enabled_cameras()
-        logger.info(f"Enabled cameras count: {len(cameras)}")
+        Returns:
+            list: config_manager.get_enabled_cameras() 결과
+        """
+        if self._enabled_cameras_cache is None:
+            self._enabled_cameras_cache = self.config_manager.get_enabled_cameras()
+        return self._enabled_cameras_cache
 
-        if cameras:
-            for cam in cameras:
-                logger.info(f"Camera found: {cam.camera_id} - {cam.name} - enabled: {cam.enabled}")
+    def _assign_window_handles_to_streams(self):
+        """
+        Assign window handles from grid channels to camera streams
 
-        # Single camera setup - only use first camera
-        if cameras:
-            camera = cameras[0]
-            channel = self.grid_view.get_channel(0)
-            if channel:
-                channel.update_camera_info(camera.camera_id, camera.name)
-                logger.debug(f"Assigned {camera.camera_id} to single channel")
-        else:
-            logger.warning("No enabled cameras found in configuration!")
+        채널 할당이나 스트림 구성이 바뀌지 않았으면 (Connect All 반복 등) 생략
+        """
+        if not self._channel_assignment_dirty:
+            logger.debug("Channel assignment unchanged - skip window handle assignment")
+            return
+        self._channel_assignment_dirty = False
 
-    def _assign_window_handles_to_streams(self):
-        """Assign window handles from grid channels to camera streams"""
         logger.info("Assigning window handles to camera streams...")
 
-        # 디버깅을 위해 모든 채널과 카메라 정보 출력
-        logger.debug(f"Total channels: {len(self.grid_view.channels)}")
-        logger.debug(f"Total camera streams: {len(self.camera_list.camera_streams)}")
+        # 디버깅을 위해 모든 채널과 카메라 정보 출력 (DEBUG 레벨이 꺼져 있으면 문자열 생성 생략)
+        logger.debug("Total channels: {}", len(self.grid_view.channels))
+        logger.debug("Total camera streams: {}", len(self.camera_list.camera_streams))
 
-        # 먼저 모든 채널 정보 확인
-        for i, channel in enumerate(self.grid_view.channels[:16]):
-            logger.debug(f"Channel {i}: camera_id={channel.camera_id}, has_handle={channel.get_window_handle() is not None}")
+        # 채널 정보 확인 + 카메라 ID → (채널 인덱스, 채널) 매핑 생성 (1회 순회)
+        channel_by_camera = {}
+        for i, channel in enumerate(islice(self.grid_view.channels, 16)):
+            # 윈도우 핸들은 아래 매칭 단계에서 할당된 채널에 대해서만 조회/출력
+            logger.debug("Channel {}: camera_id={}", i, channel.camera_id)
+            if channel.camera_id and channel.camera_id not in channel_by_camera:
+                channel_by_camera[channel.camera_id] = (i, channel)
 
         # 카메라 ID를 기준으로 매칭
         for camera_id, stream in self.camera_list.camera_streams.items():
             # 해당 카메라 ID를 가진 채널 찾기
-            window_handle_assigned = False
-            for i, channel in enumerate(self.grid_view.channels[:16]):
-                if channel.camera_id == camera_id:
-                    window_handle = channel.get_window_handle()
-                    if window_handle:
-                        stream.window_handle = window_handle
-                        logger.success(f"✓ Assigned window handle to {camera_id} (channel {i}): {window_handle}")
-                        window_handle_assigned = True
-                    else:
-                        logger.warning(f"✗ No window handle available for {camera_id} (channel {i})")
-                    break
+            entry = channel_by_camera.get(camera_id)
+            if entry is None:
+                logger.warning(f"✗ Camera {camera_id} not assigned to any channel")
+                continue
 
-            if not window_handle_assigned:
+            i, channel = entry
+            window_handle = channel.get_window_handle()
+            if window_handle:
+                stream.window_handle = window_handle
+                logger.success(f"✓ Assigned window handle to {camera_id} (channel {i}): {window_handle}")
+            else:
+                logger.warning(f"✗ No window handle available for {camera_id} (channel {i})")
                 logger.warning(f"✗ Camera {camera_id} not assigned to any channel")
 
     def _auto_connect_cameras(self):
@@ -755,24 +1153,22 @@ class MainWindow(QMainWindow):
         """
         logger.info("Auto-connecting cameras with streaming_enabled_start=true...")
 
-        cameras = self.config_manager.get_enabled_cameras()
+        cameras = self._enabled_cameras()
 
         # streaming_enabled_start가 true인 카메라들을 찾아서 연결
         auto_connect_count = 0
 
         for camera in cameras:
-            if hasattr(camera, 'streaming_enabled_start') and camera.streaming_enabled_start:
+            if camera.streaming_enabled_start:
                 logger.info(f"Auto-connecting camera: {camera.name} ({camera.camera_id})")
 
                 # camera_list에서 해당 camera_item 찾기 및 선택
                 if camera.camera_id in self.camera_list.camera_items:
                     camera_item = self.camera_list.camera_items[camera.camera_id]
 
-                    # 아이템 선택 (camera_list_widget의 _connect_camera가 선택된 아이템 사용)
-                    self.camera_list.list_widget.setCurrentItem(camera_item)
-
                     # camera_list_widget의 Connect 기능 재사용
-                    self.camera_list._connect_camera()
+                    # (아이템을 직접 전달 - setCurrentItem으로 선택 변경 시그널을 N번 발생시키지 않음)
+                    self.camera_list._connect_camera(camera_item)
                     auto_connect_count += 1
                 else:
                     logger.warning(f"Camera {camera.camera_id} not found in camera list")
@@ -812,60 +1208,116 @@ class MainWindow(QMainWindow):
         logger.info("Updating window handles after layout change (no pipeline restart)...")
 
         # 현재 활성 스트림 목록
-        cameras = self.config_manager.get_enabled_cameras()
+        cameras = self._enabled_cameras()
 
-        # 카메라와 채널 매핑 업데이트
-        for i, camera in enumerate(cameras[:len(self.grid_view.channels)]):
-            channel = self.grid_view.get_channel(i)
-            if not channel:
-                continue
+        # 카메라와 채널 매핑 업데이트 (채널 목록을 1회 바인딩, 인덱스별 get_channel 호출 없음)
+        # (채널별 update_camera_info/set_connected 무효화를 1회 repaint로 묶음)
+        self.grid_view.setUpdatesEnabled(False)
+        try:
+            for i, (channel, camera) in enumerate(zip(self.grid_view.channels, cameras)):
 
-            # 채널에 카메라 정보 업데이트
-            channel.update_camera_info(camera.camera_id, camera.name)
+                # 채널에 카메라 정보 업데이트
+                channel.update_camera_info(camera.camera_id, camera.name)
 
-            # 해당 카메라의 스트림 가져오기
-            stream = self.camera_list.get_camera_stream(camera.camera_id)
-            if stream and stream.is_connected():
-                # 연결 상태 유지
-                channel.set_connected(True)
+                # 해당 카메라의 스트림 가져오기
+                stream = self.camera_list.get_camera_stream(camera.camera_id)
+                if stream and stream.is_connected():
+                    # 연결 상태 유지
+                    channel.set_connected(True)
 
-                # 새 윈도우 핸들 가져오기
-                new_window_handle = channel.get_window_handle()
+                    # 새 윈도우 핸들 가져오기
+                    new_window_handle = channel.get_window_handle()
 
-                if new_window_handle and stream.gst_pipeline and stream.gst_pipeline.video_sink:
-                    try:
-                        # 파이프라인 중단 없이 윈도우 핸들만 업데이트
-                        stream.gst_pipeline.video_sink.set_window_handle(int(new_window_handle))
-                        logger.success(f"✓ Updated window handle for {camera.camera_id} without interruption")
-                    except Exception as e:
-                        logger.warning(f"Failed to update window handle for {camera.camera_id}: {e}")
-                        # 실패 시 파이프라인 재시작 필요할 수 있음
-                        logger.info(f"Attempting pipeline restart for {camera.camera_id}")
-                        stream.disconnect()
-                        stream.window_handle = new_window_handle
-                        if stream.connect():
-                            channel.set_connected(True)
-                            logger.success(f"✓ Restarted {camera.camera_id} after handle update failure")
-                else:
-                    if not new_window_handle:
-                        logger.warning(f"No window handle available for channel {i}")
+                    pipeline = stream.gst_pipeline
+                    if new_window_handle and pipeline and pipeline.video_sink:
+                        handle = int(new_window_handle)
+
+                        # 채널 위젯이 재사용되어 핸들이 그대로면 재설정 생략, 현재 프레임만 다시 그림
+                        if pipeline.window_handle is not None and int(pipeline.window_handle) == handle:
+                            self._expose_video_sink(pipeline.video_sink, camera.camera_id)
+                            logger.debug("Window handle unchanged for {} - exposed only", camera.camera_id)
+                            continue
 
+                        try:
+                            # 파이프라인 중단 없이 윈도우 핸들만 업데이트
+                            pipeline.video_sink.set_window_handle(handle)
+                            # 재연결/prepare-window-handle 시 새 핸들을 사용하도록 기록
+                            pipeline.window_handle = handle
+                            stream.window_handle = handle
+                            self._expose_video_sink(pipeline.video_sink, camera.camera_id)
+                            logger.success(f"✓ Updated window handle for {camera.camera_id} without interruption")
+                        except Exception as e:
+                            logger.warning(f"Failed to update window handle for {camera.camera_id}: {e}")
+                            # 실패 시 파이프라인 재시작 필요할 수 있음
+                            logger.info(f"Attempting pipeline restart for {camera.camera_id}")
+                            stream.disconnect()
+                            stream.window_handle = new_window_handle
+                            if stream.connect():
+                                channel.set_connected(True)
+                                logger.success(f"✓ Restarted {camera.camera_id} after handle update failure")
+                    else:
+                        if not new_window_handle:
+                            logger.warning(f"No window handle available for channel {i}")
+        finally:
+            self.grid_view.setUpdatesEnabled(True)
+            self.grid_view.update()
+
+        self._rebuild_channel_map()
         logger.success("Layout change completed - pipelines maintained")
 
+    def _rebuild_channel_map(self):
+        """카메라 할당 변경 후 GridView의 카메라 ID → 채널 캐시 재구성 및 핸들 재할당 예약"""
+        self._channel_assignment_dirty = True
+        self.grid_view.rebuild_camera_map()
+
+    @staticmethod
+    def _expose_video_sink(video_sink, camera_id: str):
+        """
+        비디오 싱크에 현재 프레임 다시 그리기 요청 (GstVideoOverlay.expose)
+
+        Args:
+            video_sink: GstVideoOverlay를 구현한 비디오 싱크
+            camera_id: 로그용 카메라 ID
+        """
+        try:
+            video_sink.expose()
+        except Exception as e:
+            logger.debug("expose() not available for {}: {}", camera_id, e)
+
     def _load_ptz_keys(self):
         """PTZ 키 설정 로드"""
         self.ptz_keys = self.config_manager.config.get("ptz_keys", {})
+        self._ptz_key_to_action = self._build_key_map(self.ptz_keys)
         logger.info(f"PTZ keys loaded: {len(self.ptz_keys)} keys")
 
     def _load_menu_keys(self):
         """메뉴 키 설정 로드"""
         self.menu_keys = self.config_manager.config.get("menu_keys", {})
+        self._menu_key_to_action = self._build_key_map(self.menu_keys)
         logger.info(f"Menu keys loaded: {len(self.menu_keys)} keys")
 
         # 디버그용 로그
         if "program_exit" in self.menu_keys:
             logger.debug(f"Program exit key: {self.menu_keys['program_exit']}")
 
+    @staticmethod
+    def _build_key_map(keys: dict) -> dict:
+        """
+        액션 → 키 설정을 대문자 키 → 액션 역방향 맵으로 변환
+
+        같은 키가 여러 액션에 지정된 경우 기존 선형 탐색과 동일하게 먼저 정의된 액션 사용
+
+        Args:
+            keys: {action: key_string} 설정
+
+        Returns:
+            {KEY_STRING: action}
+        """
+        key_map = {}
+        for action, config_key in keys.items():
+            key_map.setdefault(config_key.upper(), action)
+        return key_map
+
     def _update_playback_dock_size(self):
         """Update playback dock height to 30% of window height"""
         if not self.playback_dock:
@@ -877,6 +1329,10 @@ class MainWindow(QMainWindow):
             # Calculate 30% of window height
             target_height = int(window_height * 0.3)
 
+            # 이미 목표 높이면 resizeDocks(전체 Dock 재배치) 생략
+            if self.playback_dock.height() == target_height:
+                return
+
             # Use resizeDocks to set the height
             self.resizeDocks([self.playback_dock], [target_height], Qt.Vertical)
             logger.debug(f"Playback dock height set to {target_height}px (30% of {window_height}px)")
@@ -886,59 +1342,113 @@ class MainWindow(QMainWindow):
         super().resizeEvent(event)
 
         # Update playback dock size when window is resized
-        if hasattr(self, 'playback_dock'):
-            self._update_playback_dock_size()
+        # (드래그 중 연속 이벤트는 50ms 디바운스로 마지막 크기에서 1회만 처리)
+        if self.playback_dock is not None:
+            self._resize_timer.start(50)
+
+        self._schedule_ui_state_save()
+
+    def moveEvent(self, event):
+        """Handle window move event to persist window position"""
+        super().moveEvent(event)
+        self._schedule_ui_state_save()
+
+    def _schedule_ui_state_save(self):
+        """
+        UI 상태 저장 예약 (드래그 중 연속 이벤트는 마지막 1회로 병합)
+
+        창이 표시되기 전(초기화 중), 전체화면, UI 자동 숨김 상태의 위치/Dock 표시는
+        사용자가 지정한 상태가 아니므로 저장하지 않음
+        """
+        if not self.isVisible() or self.isFullScreen() or self.ui_hidden:
+            return
+        self._save_timer.start(_UI_SAVE_DEBOUNCE_MS)
+
+    def _save_ui_state_in_background(self):
+        """디바운스 만료 시 UI 상태 저장 (DB 쓰기는 QThreadPool에서 수행)"""
+        self._save_dock_state(background=True)
 
     def _on_camera_selected(self, camera_id: str):
         """Handle camera selection from list"""
-        logger.debug(f"Camera selected: {camera_id}")
+        logger.debug("Camera selected: {}", camera_id)
 
         # PTZ Controller 생성 (카메라가 PTZ 지원하는 경우)
         camera = self.config_manager.get_camera(camera_id)
         if camera and camera.ptz_type and camera.ptz_type.upper() != "NONE":
             try:
-                self.ptz_controller = PTZController(camera)
+                self.ptz_controller = self._get_ptz_controller(camera)
                 logger.info(f"PTZ Controller created for camera: {camera_id} (type: {camera.ptz_type})")
             except Exception as e:
                 logger.error(f"Failed to create PTZ Controller: {e}")
                 self.ptz_controller = None
         else:
             self.ptz_controller = None
-            logger.debug(f"Camera {camera_id} does not support PTZ")
+            logger.debug("Camera {} does not support PTZ", camera_id)
+
+    def _get_ptz_controller(self, camera):
+        """
+        카메라의 PTZController 반환 (camera_id별로 1회 생성 후 재사용)
+
+        Args:
+            camera: PTZ를 지원하는 Camera 설정
+
+        Returns:
+            PTZController
+        """
+        controller = self._ptz_controllers.get(camera.camera_id)
+        if controller is None:
+            # PTZ 카메라에서만 필요하므로 지연 import (urllib/http 모듈 로드를 시작 시점에서 제외)
+            from camera.ptz_controller import PTZController
+            controller = PTZController(camera)
+            self._ptz_controllers[camera.camera_id] = controller
+        return controller
 
     def _on_camera_added(self, camera_config):
         """Handle camera added"""
         logger.info(f"Camera added: {camera_config.name}")
-        self._auto_assign_cameras()
+        self._enabled_cameras_cache = None
+        self._channel_assignment_dirty = True  # 새 CameraStream은 윈도우 핸들이 없음
+        self._assign_first_enabled_camera(self._enabled_cameras())
         # Add to recording control
-        if hasattr(camera_config, 'rtsp_url'):
-            self.recording_control.add_camera(
-                camera_config.camera_id,
-                camera_config.name,
-                camera_config.rtsp_url,
-                camera_config.enabled
-            )
+        # rtsp_url은 CameraConfigData의 필수 필드
+        self.recording_control.add_camera(
+            camera_config.camera_id,
+            camera_config.name,
+            camera_config.rtsp_url,
+            camera_config.enabled
+        )
+        self._update_status()
+
+    def _on_camera_updated(self, camera_config):
+        """Handle camera updated (enabled 등이 바뀌었을 수 있으므로 활성 카메라 캐시 무효화)"""
+        self._enabled_cameras_cache = None
 
     def _on_camera_removed(self, camera_id: str):
         """Handle camera removed"""
         logger.info(f"Camera removed: {camera_id}")
-        # Clear channel if assigned
-        for channel in self.grid_view.channels:
-            if channel.camera_id == camera_id:
-                channel.update_camera_info("", "No Camera")
-                channel.set_connected(False)
+        self._enabled_cameras_cache = None
+        self._channel_assignment_dirty = True
+        self._connected_cameras.discard(camera_id)
+        self._ptz_controllers.pop(camera_id, None)
+        # Clear channel if assigned (카메라는 최대 1개 채널에만 할당됨)
+        channel = self.grid_view.channel_for_camera(camera_id)
+        if channel:
+            channel.reset()
         # Remove from recording control
         self.recording_control.remove_camera(camera_id)
+        self._update_status()
 
     def _on_camera_connected(self, camera_id: str):
         """Handle camera connected"""
         logger.info(f"Camera connected: {camera_id}")
+        self._connected_cameras.add(camera_id)
+        self._update_status()
 
         # PTZ Controller 생성 (연결된 카메라가 PTZ 지원하는 경우)
         camera = self.config_manager.get_camera(camera_id)
         if camera and camera.ptz_type and camera.ptz_type.upper() != "NONE":
             try:
-                self.ptz_controller = PTZController(camera)
+                self.ptz_controller = self._get_ptz_controller(camera)
                 # Grid View에 PTZ Controller 전달
                 if self.grid_view:
                     self.grid_view.ptz_controller = self.ptz_controller
@@ -951,7 +1461,7 @@ class MainWindow(QMainWindow):
             self.ptz_controller = None
             if self.grid_view:
                 self.grid_view.ptz_controller = None
-            logger.debug(f"Camera {camera_id} does not support PTZ")
+            logger.debug("Camera {} does not support PTZ", camera_id)
 
         # Get camera stream
         stream = self.camera_list.get_camera_stream(camera_id)
@@ -960,118 +1470,171 @@ class MainWindow(QMainWindow):
             return
 
         # Find channel with this camera and update
-        channel_found = False
-        for channel in self.grid_view.channels:
-            if channel.camera_id == camera_id:
-                channel_found = True
-                # Get window handle and set it on the pipeline
-                window_handle = channel.get_window_handle()
-                if window_handle and stream.gst_pipeline:
-                    # Set video sink to render in widget
-                    if stream.gst_pipeline.video_sink:
-                        try:
-                            stream.gst_pipeline.video_sink.set_window_handle(int(window_handle))
-                            logger.info(f"Set window handle for camera {camera_id}: {window_handle}")
-                        except Exception as e:
-                            logger.warning(f"Failed to set window handle for {camera_id}: {e}")
-                else:
-                    logger.warning(f"Could not set window handle for {camera_id} - handle: {window_handle}, pipeline: {stream.gst_pipeline}")
-
-                channel.set_connected(True)
-                break
+        channel = self.grid_view.channel_for_camera(camera_id)
+        if channel:
+            # Get window handle and set it on the pipeline
+            window_handle = channel.get_window_handle()
+            if window_handle and stream.gst_pipeline:
+                # Set video sink to render in widget
+                if stream.gst_pipeline.video_sink:
+                    try:
+                        stream.gst_pipeline.video_sink.set_window_handle(int(window_handle))
+                        logger.info(f"Set window handle for camera {camera_id}: {window_handle}")
+                    except Exception as e:
+                        logger.warning(f"Failed to set window handle for {camera_id}: {e}")
+            else:
+                logger.warning(f"Could not set window handle for {camera_id} - handle: {window_handle}, pipeline: {stream.gst_pipeline}")
 
-        if not channel_found:
+            channel.set_connected(True)
+        else:
             logger.warning(f"No channel found for camera {camera_id}")
 
         # Update RecordingStatusItem 연결 상태
         if camera_id in self.recording_control.camera_items:
             self.recording_control.camera_items[camera_id].set_connected(True)
-            logger.debug(f"[UI SYNC] Updated RecordingStatusItem connection status for {camera_id}: True")
+            logger.debug("[UI SYNC] Updated RecordingStatusItem connection status for {}: True", camera_id)
 
-        # 녹화 상태 콜백 등록 (start_recording()에서 자동으로 콜백 호출)
-        if stream and stream.gst_pipeline:
-            def on_recording_state_change(cam_id: str, is_recording: bool):
-                """파이프라인에서 녹화 상태 변경 시 UI 업데이트"""
-                logger.debug(f"[UI SYNC] Recording state callback: {cam_id} -> {is_recording}")
-
-                # Update Grid View (streaming UI)
-                for channel in self.grid_view.channels:
-                    if channel.camera_id == cam_id:
-                        channel.set_recording(is_recording)
-                        logger.debug(f"[UI SYNC] Updated Grid View for {cam_id}: recording={is_recording}")
-                        break
-
-                # Update Recording Control Widget
-                self.recording_control.update_recording_status(cam_id, is_recording)
-
-                # Emit signal for recording control widget
-                if is_recording:
-                    self.recording_control.recording_started.emit(cam_id)
-                else:
-                    self.recording_control.recording_stopped.emit(cam_id)
-
-            stream.gst_pipeline.register_recording_callback(on_recording_state_change)
-            logger.debug(f"[UI SYNC] Registered recording callback for {camera_id}")
-
-            # 연결 상태 콜백 등록
-            def on_connection_state_change(cam_id: str, is_connected: bool):
-                """파이프라인에서 연결 상태 변경 시 UI 업데이트"""
-                logger.debug(f"[CONNECTION SYNC] Connection state callback: {cam_id} -> {is_connected}")
-
-                # Update Grid View
-                for channel in self.grid_view.channels:
-                    if channel.camera_id == cam_id:
-                        channel.set_connected(is_connected)
-                        logger.debug(f"[CONNECTION SYNC] Updated Grid View for {cam_id}: connected={is_connected}")
-                        break
-
-                # Update Recording Control Widget
-                if cam_id in self.recording_control.camera_items:
-                    self.recording_control.camera_items[cam_id].set_connected(is_connected)
-                    logger.debug(f"[CONNECTION SYNC] Updated RecordingStatusItem for {cam_id}: connected={is_connected}")
-
-            stream.gst_pipeline.register_connection_callback(on_connection_state_change)
-            logger.debug(f"[CONNECTION SYNC] Registered connection callback for {camera_id}")
-
-        # 자동 녹화 시작 (recording_enabled_start 설정 확인)
-        camera_config = self.config_manager.get_camera(camera_id)
-        if camera_config and camera_config.recording_enabled_start:
-            logger.info(f"Auto-recording enabled for {camera_config.name} ({camera_id})")
-            # 파이프라인 안정화를 위해 500ms 지연 후 녹화 시작
+        # 녹화/연결 상태 콜백 등록
+        self._register_pipeline_callbacks(camera_id, stream)
+
+        # 자동 녹화 시작 (recording_enabled_start 설정 확인, 위에서 조회한 camera 재사용)
+        if camera and camera.recording_enabled_start:
+            logger.info(f"Auto-recording enabled for {camera.name} ({camera_id})")
+            # 파이프라인 안정화를 위해 약간의 지연 후 녹화 시작
             # start_recording()이 valve를 열고 콜백을 호출하여 UI 업데이트
-            QTimer.singleShot(500, lambda: self._auto_start_recording(camera_id))
+            self._schedule_auto_record(camera_id)
+
+    def _on_camera_reconnecting(self, camera_id: str):
+        """
+        초기 연결 실패 후 파이프라인 자동 재연결 중인 카메라 처리
+
+        재연결 성공/실패는 camera_connected 시그널 없이 파이프라인 콜백으로만 통지되므로
+        이 시점에 콜백을 등록해야 상태바/채널/Recording Control에 반영됨
+        """
+        logger.info(f"Camera reconnecting in background: {camera_id}")
+        stream = self.camera_list.get_camera_stream(camera_id)
+        if stream:
+            self._register_pipeline_callbacks(camera_id, stream)
+
+    def _register_pipeline_callbacks(self, camera_id: str, stream):
+        """
+        스트림 파이프라인에 녹화/연결 상태 콜백 등록
+
+        바운드 메서드는 재연결 시에도 동등 비교되므로 파이프라인 쪽 중복 등록 방지가 동작함
+
+        Args:
+            camera_id: 카메라 ID
+            stream: CameraStream
+        """
+        pipeline = stream.gst_pipeline
+        if pipeline is None:
+            return
+
+        # 녹화 상태 콜백 등록 (start_recording()에서 자동으로 콜백 호출)
+        pipeline.register_recording_callback(self._handle_recording_state)
+        logger.debug("[UI SYNC] Registered recording callback for {}", camera_id)
+
+        # 연결 상태 콜백 등록
+        pipeline.register_connection_callback(self._handle_connection_state)
+        logger.debug("[CONNECTION SYNC] Registered connection callback for {}", camera_id)
+
+    def _handle_recording_state(self, cam_id: str, is_recording: bool):
+        """파이프라인에서 녹화 상태 변경 시 UI 업데이트 (GUI 스레드로 전달)"""
+        logger.debug("[UI SYNC] Recording state callback: {} -> {}", cam_id, is_recording)
+        self.recording_state_changed.emit(cam_id, is_recording)
+
+    def _handle_connection_state(self, cam_id: str, is_connected: bool):
+        """파이프라인에서 연결 상태 변경 시 UI 업데이트 (GUI 스레드로 전달)"""
+        logger.debug("[CONNECTION SYNC] Connection state callback: {} -> {}", cam_id, is_connected)
+        self.connection_state_changed.emit(cam_id, is_connected)
+
+    def _schedule_auto_record(self, camera_id: str):
+        """
+        _AUTO_RECORD_DELAY 후 자동 녹화 시작 예약
+
+        모든 예약이 같은 지연을 사용하므로 큐는 deadline 순서가 유지됨
+
+        Args:
+            camera_id: 카메라 ID
+        """
+        self._pending_auto_record.append((time.monotonic() + _AUTO_RECORD_DELAY, camera_id))
+        if not self._auto_record_timer.isActive():
+            self._auto_record_timer.start(int(_AUTO_RECORD_DELAY * 1000))
+
+    def _drain_auto_record(self):
+        """deadline이 지난 자동 녹화 예약 실행 후 다음 예약 시점으로 타이머 재설정"""
+        pending = self._pending_auto_record
+        now = time.monotonic()
+        while pending and pending[0][0] <= now:
+            _, camera_id = pending.popleft()
+            self._auto_start_recording(camera_id)
+
+        if pending:
+            remaining_ms = max(0, int((pending[0][0] - time.monotonic()) * 1000))
+            self._auto_record_timer.start(remaining_ms)
+
+    def _on_cameras_connected(self, camera_ids: list):
+        """
+        Connect All 결과 일괄 처리 (카메라별 채널 갱신을 1회 repaint로 묶음)
+
+        Args:
+            camera_ids: 연결된 카메라 ID 목록
+        """
+        self.grid_view.setUpdatesEnabled(False)
+        try:
+            for camera_id in camera_ids:
+                self._on_camera_connected(camera_id)
+        finally:
+            self.grid_view.setUpdatesEnabled(True)
+            self.grid_view.update()
+
+    def _on_cameras_disconnected(self, camera_ids: list):
+        """
+        Disconnect All 결과 일괄 처리 (카메라별 채널 갱신을 1회 repaint로 묶음)
+
+        Args:
+            camera_ids: 연결 해제된 카메라 ID 목록
+        """
+        self.grid_view.setUpdatesEnabled(False)
+        try:
+            for camera_id in camera_ids:
+                self._on_camera_disconnected(camera_id)
+        finally:
+            self.grid_view.setUpdatesEnabled(True)
+            self.grid_view.update()
 
     def _on_camera_disconnected(self, camera_id: str):
         """Handle camera disconnected"""
         logger.info(f"Camera disconnected: {camera_id}")
+        self._connected_cameras.discard(camera_id)
+        self._update_status()
 
         # Find channel with this camera and update
-        for channel in self.grid_view.channels:
-            if channel.camera_id == camera_id:
-                channel.set_connected(False)
-                break
+        channel = self.grid_view.channel_for_camera(camera_id)
+        if channel:
+            channel.set_connected(False)
 
         # Update RecordingStatusItem 연결 상태
         if camera_id in self.recording_control.camera_items:
             self.recording_control.camera_items[camera_id].set_connected(False)
-            logger.debug(f"[UI SYNC] Updated RecordingStatusItem connection status for {camera_id}: False")
+            logger.debug("[UI SYNC] Updated RecordingStatusItem connection status for {}: False", camera_id)
 
     def _on_channel_double_clicked(self, channel_index: int):
         """Handle channel double-click"""
-        logger.debug(f"Channel {channel_index} double-clicked")
+        logger.debug("Channel {} double-clicked", channel_index)
 
     def _on_layout_changed(self, layout: tuple):
         """Handle layout change"""
         rows, cols = layout
 
         # Update status bar label
-        self.layout_label.setText(f"Layout: {rows}x{cols}")
+        self.layout_label.setText(_LAYOUT_FMT % (rows, cols))
         logger.info(f"Layout changed to {rows}x{cols}")
 
-        # Update menu check state
-        if hasattr(self, 'layout_actions'):
-            for size, action in self.layout_actions.items():
-                action.setChecked(size == layout)
+        # Update menu check state (exclusive 액션 그룹이므로 해당 액션만 체크, 메뉴 생성 전이면 생략)
+        action = self.layout_actions.get(layout)
+        if action is not None:
+            action.setChecked(True)
 
         # Save layout to config
         self.config_manager.update_ui_layout(rows, cols)
@@ -1082,56 +1645,96 @@ class MainWindow(QMainWindow):
         # 레이아웃 변경 시 윈도우 핸들 재할당 및 파이프라인 업데이트
         self._update_window_handles_after_layout_change()
 
-    def _populate_recording_control(self):
-        """Populate recording control with cameras"""
-        # ⭐ 중요: 기존 카메라 목록을 모두 제거한 후 재등록
-        # (설정 변경 시 중복 추가 방지)
-        cameras_to_remove = list(self.recording_control.camera_items.keys())
-        for camera_id in cameras_to_remove:
-            self.recording_control.remove_camera(camera_id)
-            logger.debug(f"Removed camera from recording control: {camera_id}")
+    def _initialize_cameras(self):
+        """
+        설정의 카메라 목록을 1회 순회하며 채널 할당과 Recording Control 등록을 함께 수행
 
-        # 새로운 카메라 목록 추가
+        get_all_cameras()와 get_enabled_cameras()는 모두 display_order 기준 안정 정렬이므로
+        전체 목록에서 처음 나오는 활성 카메라가 기존 단일 채널 할당 대상과 동일
+        """
         cameras = self.config_manager.get_all_cameras()
-        for camera in cameras:
-            if hasattr(camera, 'rtsp_url'):
-                self.recording_control.add_camera(
+        enabled_cameras = []
+
+        # 카메라별 제거/추가로 인한 레이아웃 무효화·repaint를 마지막 1회로 묶음
+        recording_control = self.recording_control
+        recording_control.setUpdatesEnabled(False)
+        try:
+            # ⭐ 중요: 기존 카메라 목록을 모두 제거한 후 재등록
+            # (설정 변경 시 중복 추가 방지)
+            cameras_to_remove = list(recording_control.camera_items.keys())
+            for camera_id in cameras_to_remove:
+                recording_control.remove_camera(camera_id)
+                logger.debug("Removed camera from recording control: {}", camera_id)
+
+            for camera in cameras:
+                recording_control.add_camera(
                     camera.camera_id,
                     camera.name,
                     camera.rtsp_url,
                     camera.enabled
                 )
-                logger.debug(f"Added camera to recording control: {camera.name}")
+                logger.debug("Added camera to recording control: {}", camera.name)
+
+                if camera.enabled:
+                    enabled_cameras.append(camera)
+                    logger.debug("Camera found: {} - {} - enabled: {}",
+                                 camera.camera_id, camera.name, camera.enabled)
+        finally:
+            recording_control.setUpdatesEnabled(True)
+            recording_control.updateGeometry()
+
+        # 같은 순회에서 얻은 활성 카메라 목록으로 캐시 채움
+        self._enabled_cameras_cache = enabled_cameras
+        logger.info(f"Enabled cameras count: {len(enabled_cameras)} (configured: {len(cameras)})")
+
+        self._assign_first_enabled_camera(enabled_cameras)
+
+    def _assign_first_enabled_camera(self, enabled_cameras):
+        """
+        첫 번째 활성 카메라를 채널 0에 할당 (단일 카메라 구성)
+
+        Args:
+            enabled_cameras: 활성 카메라 목록
+        """
+        # Single camera setup - only use first camera
+        if enabled_cameras:
+            camera = enabled_cameras[0]
+            channel = self.grid_view.get_channel(0)
+            if channel:
+                channel.update_camera_info(camera.camera_id, camera.name)
+                logger.debug("Assigned {} to single channel", camera.camera_id)
+        else:
+            logger.warning("No enabled cameras found in configuration!")
+
+        self._rebuild_channel_map()
 
     def _on_recording_started(self, camera_id: str):
         """Handle recording started"""
         logger.info(f"Recording started for camera: {camera_id}")
 
         # Update channel indicator
-        for channel in self.grid_view.channels:
-            if channel.camera_id == camera_id:
-                channel.set_recording(True)
-                break
+        channel = self.grid_view.channel_for_camera(camera_id)
+        if channel:
+            channel.set_recording(True)
 
         # Update recording control widget UI
         if camera_id in self.recording_control.camera_items:
             self.recording_control.camera_items[camera_id].set_recording(True)
-            logger.debug(f"Updated recording control widget for {camera_id} (started)")
+            logger.debug("Updated recording control widget for {} (started)", camera_id)
 
     def _on_recording_stopped(self, camera_id: str):
         """Handle recording stopped"""
         logger.info(f"Recording stopped for camera: {camera_id}")
 
         # Update channel indicator
-        for channel in self.grid_view.channels:
-            if channel.camera_id == camera_id:
-                channel.set_recording(False)
-                break
+        channel = self.grid_view.channel_for_camera(camera_id)
+        if channel:
+            channel.set_recording(False)
 
         # Update recording control widget UI
         if camera_id in self.recording_control.camera_items:
             self.recording_control.camera_items[camera_id].set_recording(False)
-            logger.debug(f"Updated recording control widget for {camera_id} (stopped)")
+            logger.debug("Updated recording control widget for {} (stopped)", camera_id)
 
     def _show_settings_dialog(self):
         """Show integrated settings dialog"""
@@ -1151,6 +1754,7 @@ class MainWindow(QMainWindow):
     def _on_settings_changed(self):
         """Handle settings changes"""
         logger.info("Settings changed - reloading configuration")
+        self._enabled_cameras_cache = None
 
         # 설정 변경 후 필요한 처리
         # 예: 테마 적용, 레이아웃 변경, 상태바 표시 등
@@ -1160,24 +1764,40 @@ class MainWindow(QMainWindow):
 
         # 상태바 표시 상태 업데이트
         ui_config = self.config_manager.ui_config
-        if ui_config.show_status_bar:
-            self.status_bar.show()
-        else:
-            self.status_bar.hide()
 
-        # Dock 상태 업데이트
-        dock_state = ui_config.dock_state
-        self.camera_dock.setVisible(dock_state.get("camera_visible", True))
-        self.recording_dock.setVisible(dock_state.get("recording_visible", True))
-        self.playback_dock.setVisible(dock_state.get("playback_visible", False))
+        # 자동 숨김 지연 시간 캐시 갱신
+        self._auto_hide_delay = int(ui_config.fullscreen_auto_hide_delay_seconds)
 
-        # 레이아웃 재적용
-        rows, cols = self.config_manager.get_default_layout()
-        self.grid_view.set_layout(rows, cols)
+        # 상태바 라벨 색상 임계값 갱신 (Performance 탭 변경 반영)
+        self._load_status_thresholds()
 
-        # 카메라 설정 업데이트 (효율적인 방법: 객체 재사용)
-        if hasattr(self, 'camera_list') and self.camera_list:
-            self.camera_list.update_camera_streams_config()
+        # 카메라 PTZ 설정(ptz_type/port/channel, RTSP 인증)이 바뀌었을 수 있으므로 PTZ 컨트롤러 캐시 초기화
+        self._ptz_controllers.clear()
+
+        # 상태바 표시 여부가 실제로 바뀐 경우에만 show/hide (불필요한 relayout 방지)
+        if self.status_bar.isHidden() == ui_config.show_status_bar:
+            self.status_bar.setVisible(ui_config.show_status_bar)
+
+        # Dock 상태 업데이트 (바뀐 dock만 setVisible)
+        self._apply_dock_visibility(ui_config.dock_state)
+
+        # 레이아웃 재적용 + 카메라 재할당을 1회 repaint로 묶음
+        self.setUpdatesEnabled(False)
+        try:
+            rows, cols = self.config_manager.get_default_layout()
+            if self.grid_view.current_layout != (rows, cols):
+                self.grid_view.set_layout(rows, cols)
+
+            # 카메라 설정 업데이트 (효율적인 방법: 객체 재사용)
+            if self.camera_list:
+                self.camera_list.update_camera_streams_config()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+        # 카메라 추가/삭제가 있었을 수 있으므로 연결 상태 표시 갱신
+        self._resync_connected_cameras()
+        self._update_status()
 
         logger.info("Settings applied successfully")
 
@@ -1188,7 +1808,7 @@ class MainWindow(QMainWindow):
         # 윈도우 핸들이 이미 할당되어 있는지 확인하고, 없으면 재할당
         self._assign_window_handles_to_streams()
 
-        # 그 다음 연결
+        # 그 다음 연결 (채널 갱신은 cameras_connected 일괄 처리에서 1회 repaint로 묶음)
         self.camera_list._connect_all()
 
     def _disconnect_all_cameras(self):
@@ -1197,31 +1817,50 @@ class MainWindow(QMainWindow):
 
     def _toggle_camera_dock(self, checked: bool):
         """Toggle camera dock visibility"""
+        # 이미 원하는 상태면 show/hide 이벤트(레이아웃/스타일 재계산) 생략
+        if self.camera_dock.isHidden() != checked:
+            return
         self.camera_dock.setVisible(checked)
 
     def _toggle_recording_dock(self, checked: bool):
         """Toggle recording dock visibility"""
+        # 이미 원하는 상태면 show/hide 이벤트(레이아웃/스타일 재계산) 생략
+        if self.recording_dock.isHidden() != checked:
+            return
         self.recording_dock.setVisible(checked)
 
     def _toggle_playback_dock(self, checked: bool):
         """Toggle playback dock visibility"""
+        # 이미 원하는 상태면 show/hide 이벤트(레이아웃/스타일 재계산) 생략
+        if self.playback_dock.isHidden() != checked:
+            return
         self.playback_dock.setVisible(checked)
         # 재생 독이 열릴 때 자동 스캔 제거 (사용자가 수동으로 새로고침)
 
-    def _on_camera_dock_visibility_changed(self, visible: bool):
-        """Camera dock visibility 변경 시 메뉴 액션 동기화"""
-        self.camera_dock_action.setChecked(visible)
-        logger.debug(f"Camera dock visibility changed: {visible}")
+    def _on_dock_visibility_changed(self, visible: bool):
+        """
+        Dock visibility 변경 시 메뉴 액션 동기화 예약
 
-    def _on_recording_dock_visibility_changed(self, visible: bool):
-        """Recording dock visibility 변경 시 메뉴 액션 동기화"""
-        self.recording_dock_action.setChecked(visible)
-        logger.debug(f"Recording dock visibility changed: {visible}")
+        전체화면 전환/UI 자동 숨김 등에서 시그널이 연달아 발생하므로
+        이벤트 루프 다음 턴에 최종 상태로 1회만 동기화
+        """
+        if self._dock_sync_pending:
+            return
+        self._dock_sync_pending = True
+        QTimer.singleShot(0, self._flush_dock_sync)
 
-    def _on_playback_dock_visibility_changed(self, visible: bool):
-        """Playback dock visibility 변경 시 메뉴 액션 동기화"""
-        self.playback_dock_action.setChecked(visible)
-        logger.debug(f"Playback dock visibility changed: {visible}")
+    def _flush_dock_sync(self):
+        """Dock의 현재 표시 상태를 메뉴 액션 체크 상태에 반영"""
+        self._dock_sync_pending = False
+        camera_visible = self.camera_dock.isVisible()
+        recording_visible = self.recording_dock.isVisible()
+        playback_visible = self.playback_dock.isVisible()
+
+        self.camera_dock_action.setChecked(camera_visible)
+        self.recording_dock_action.setChecked(recording_visible)
+        self.playback_dock_action.setChecked(playback_visible)
+        logger.debug("Dock visibility synced: camera={}, recording={}, playback={}",
+                     camera_visible, recording_visible, playback_visible)
 
     def toggle_fullscreen(self):
         """Toggle fullscreen mode"""
@@ -1288,43 +1927,17 @@ class MainWindow(QMainWindow):
 
     def _show_shortcuts(self):
         """Show keyboard shortcuts"""
-        shortcuts = """
-        <b>Keyboard Shortcuts:</b><br><br>
-        <b>General:</b><br>
-        Ctrl+Q - Exit<br>
-        F11 - Toggle Fullscreen<br><br>
-
-        <b>View:</b><br>
-        F11 - Toggle Fullscreen<br>
-        F - Toggle Fullscreen<br>
-        ESC - Exit Fullscreen<br><br>
-
-        <b>Camera Control:</b><br>
-        Ctrl+Shift+C - Connect Camera<br>
-        Ctrl+Shift+D - Disconnect Camera<br><br>
-
-        <b>Playback:</b><br>
-        F5 - Refresh Recordings<br>
-        Space - Play/Pause (in playback)<br>
-        """
-
-        msg = QMessageBox(self)
-        msg.setWindowTitle("Keyboard Shortcuts")
-        msg.setTextFormat(Qt.RichText)
-        msg.setText(shortcuts)
-        msg.exec_()
+        if self._shortcuts_dialog is None:
+            msg = QMessageBox(self)
+            msg.setWindowTitle("Keyboard Shortcuts")
+            msg.setTextFormat(Qt.RichText)
+            msg.setText(_SHORTCUTS_HTML)
+            self._shortcuts_dialog = msg
+        self._shortcuts_dialog.exec_()
 
     def _show_about(self):
         """Show about dialog"""
-        QMessageBox.about(
-            self,
-            f"About {self.app_name}",
-            f"<b>{self.app_name} - Network Video Recorder</b><br>"
-            f"Version {self.app_version}<br><br>"
-            "Single Camera View<br>"
-            "Built with GStreamer and PyQt5<br><br>"
-            "Optimized for single camera recording"
-        )
+        QMessageBox.about(self, f"About {self.app_name}", _ABOUT_FMT % (self.app_name, self.app_version))
 
     def _load_dock_state(self):
         """Load dock state from YAML configuration"""
@@ -1335,9 +1948,7 @@ class MainWindow(QMainWindow):
         playback_visible = dock_state.get("playback_visible", False)
 
         # Dock 표시 상태 설정
-        self.camera_dock.setVisible(camera_visible)
-        self.recording_dock.setVisible(recording_visible)
-        self.playback_dock.setVisible(playback_visible)
+        self._apply_dock_visibility(dock_state)
 
         # 메뉴 체크 상태 동기화
         self.camera_dock_action.setChecked(camera_visible)
@@ -1346,28 +1957,65 @@ class MainWindow(QMainWindow):
 
         logger.info(f"Dock state loaded from YAML - Camera: {camera_visible}, Recording: {recording_visible}, Playback: {playback_visible}")
 
-    def _save_dock_state(self):
-        """Save dock state to JSON configuration"""
-        # 현재 윈도우 위치/크기 저장
+    def _apply_dock_visibility(self, dock_state: dict):
+        """
+        Dock 표시 상태 적용
+
+        현재 상태와 다른 dock만 setVisible 호출하여 불필요한 레이아웃 재계산 방지
+
+        Args:
+            dock_state: ui_config.dock_state 딕셔너리
+        """
+        for dock, key, default in ((self.camera_dock, "camera_visible", True),
+                                   (self.recording_dock, "recording_visible", True),
+                                   (self.playback_dock, "playback_visible", False)):
+            visible = dock_state.get(key, default)
+            # isHidden()은 윈도우가 아직 표시되기 전에도 명시적 상태를 반영
+            if dock.isHidden() == visible:
+                dock.setVisible(visible)
+
+    def _save_dock_state(self, background: bool = False):
+        """
+        Save dock state to JSON configuration
+
+        Args:
+            background: True면 DB 쓰기를 QThreadPool에서 수행 (GUI 스레드 블로킹 방지)
+        """
         geometry = self.geometry()
-        self.config_manager.update_ui_window_state(
-            x=geometry.x(),
-            y=geometry.y(),
-            width=geometry.width(),
-            height=geometry.height()
-        )
+        camera_visible = self.camera_dock.isVisible()
+        recording_visible = self.recording_dock.isVisible()
+        playback_visible = self.playback_dock.isVisible()
+
+        # 마지막으로 저장된 상태와 같으면 DB 쓰기 생략
+        ui_config = self.config_manager.ui_config
+        window_state = {
+            "x": geometry.x(),
+            "y": geometry.y(),
+            "width": geometry.width(),
+            "height": geometry.height()
+        }
+        dock_state = {
+            "camera_visible": camera_visible,
+            "recording_visible": recording_visible,
+            "playback_visible": playback_visible
+        }
+        if ui_config.window_state == window_state and ui_config.dock_state == dock_state:
+            logger.debug("UI state unchanged - skip saving")
+            return
+
+        # 현재 윈도우 위치/크기 저장
+        self.config_manager.update_ui_window_state(**window_state)
 
         # 현재 Dock 표시 상태 저장
-        self.config_manager.update_ui_dock_state(
-            camera_visible=self.camera_dock.isVisible(),
-            recording_visible=self.recording_dock.isVisible(),
-            playback_visible=self.playback_dock.isVisible()
-        )
+        self.config_manager.update_ui_dock_state(**dock_state)
 
-        # JSON 파일에 저장
-        self.config_manager.save_ui_config()
+        logger.info(f"Saving UI state - Window: {geometry.x()},{geometry.y()} {geometry.width()}x{geometry.height()}, Docks: Camera={camera_visible}, Recording={recording_visible}, Playback={playback_visible}")
 
-        logger.info(f"UI state saved to JSON - Window: {geometry.x()},{geometry.y()} {geometry.width()}x{geometry.height()}, Docks: Camera={self.camera_dock.isVisible()}, Recording={self.recording_dock.isVisible()}, Playback={self.playback_dock.isVisible()}")
+        # JSON 파일에 저장 (메모리 상태는 위에서 이미 갱신됨)
+        if background:
+            QThreadPool.globalInstance().start(self._save_runnable)
+            return
+        self.config_manager.save_ui_config()
 
     def keyPressEvent(self, event):
         """키보드 누름 이벤트 처리 (메뉴 키 및 PTZ 제어)"""
@@ -1379,26 +2027,27 @@ class MainWindow(QMainWindow):
         # 먼저 menu_keys 확인 (F1-F12, Esc 등 특수 키)
         key_str = self._get_key_string(event)
 
-        # menu_keys 처리
-        for action, config_key in self.menu_keys.items():
-            if config_key.upper() == key_str.upper():
-                logger.debug(f"Menu key detected: {action} = {config_key}")
-                if self._execute_menu_action(action):
-                    event.accept()
-                    return
+        # menu_keys 처리 (역방향 맵으로 O(1) 조회)
+        action = self._menu_key_to_action.get(key_str.upper())
+        if action is not None:
+            logger.debug("Menu key detected: {} = {}", action, self.menu_keys[action])
+            if self._execute_menu_action(action):
+                event.accept()
+                return
+
+        # PTZ 컨트롤러가 없으면 PTZ 키 조회 생략
+        if self.ptz_controller is None:
+            super().keyPressEvent(event)
+            return
 
         # 일반 문자 키 처리 (PTZ 키)
         key = event.text().upper()
 
         # PTZ 키 액션 찾기
-        ptz_action = None
-        for action, config_key in self.ptz_keys.items():
-            if config_key.upper() == key:
-                ptz_action = action
-                break
+        ptz_action = self._ptz_key_to_action.get(key)
 
         if ptz_action:
-            logger.debug(f"PTZ action pressed: {ptz_action} (key='{key}')")
+            logger.debug("PTZ action pressed: {} (key='{}')", ptz_action, key)
             self._execute_ptz_action(ptz_action, pressed=True)
             event.accept()
         else:
@@ -1411,14 +2060,15 @@ class MainWindow(QMainWindow):
             event.accept()
             return
 
+        # PTZ 컨트롤러가 없으면 PTZ 키 조회 생략
+        if self.ptz_controller is None:
+            super().keyReleaseEvent(event)
+            return
+
         key = event.text().upper()
 
         # PTZ 키 액션 찾기
-        ptz_action = None
-        for action, config_key in self.ptz_keys.items():
-            if config_key.upper() == key:
-                ptz_action = action
-                break
+        ptz_action = self._ptz_key_to_action.get(key)
 
         if ptz_action:
             self._execute_ptz_action(ptz_action, pressed=False)
@@ -1434,7 +2084,7 @@ class MainWindow(QMainWindow):
             action: PTZ 액션 (zoom_in, zoom_out, up, down 등)
             pressed: True=키 누름, False=키 뗌
         """
-        logger.debug(f"_execute_ptz_action called: action={action}, pressed={pressed}")
+        logger.debug("_execute_ptz_action called: action={}, pressed={}", action, pressed)
 
         if not self.ptz_controller:
             logger.debug("PTZ Controller not available")
@@ -1443,98 +2093,56 @@ class MainWindow(QMainWindow):
         # 키를 뗄 때
         if not pressed:
             # Zoom 명령의 경우 STOP 전송
-            if action in ['zoom_in', 'zoom_out']:
+            if action in _PTZ_ZOOM_ACTIONS:
                 self.ptz_controller.zoom_stop()
-                logger.debug(f"PTZ action released: {action} -> ZOOMSTOP")
+                logger.debug("PTZ action released: {} -> ZOOMSTOP", action)
             # 방향키도 STOP 전송
-            elif action in ['pan_left', 'up', 'right_up', 'left', 'right', 'pan_down', 'down', 'right_down']:
+            elif action in _PTZ_MOVE_ACTIONS:
                 self.ptz_controller.stop()
-                logger.debug(f"PTZ action released: {action} -> STOP")
+                logger.debug("PTZ action released: {} -> STOP", action)
             return
 
         # 키를 누를 때
-        logger.debug(f"Processing PTZ pressed action: {action}")
-        if action == 'zoom_in':
-            logger.debug(f"Calling zoom_in with speed: {self.ptz_speed}")
-            self.ptz_controller.zoom_in(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Zoom In (Speed: {self.ptz_speed})", 1000)
-        elif action == 'zoom_out':
-            logger.debug(f"Calling zoom_out with speed: {self.ptz_speed}")
-            self.ptz_controller.zoom_out(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Zoom Out (Speed: {self.ptz_speed})", 1000)
-        elif action == 'ptz_speed_up':
+        logger.debug("Processing PTZ pressed action: {}", action)
+        if action == 'ptz_speed_up':
             self.ptz_speed = min(9, self.ptz_speed + 1)
-            self.statusBar().showMessage(f"PTZ Speed: {self.ptz_speed}/9", 2000)
+            self.statusBar().showMessage(_PTZ_SPEED_FMT % self.ptz_speed, 2000)
             logger.info(f"PTZ speed increased: {self.ptz_speed}/9")
         elif action == 'ptz_speed_down':
             self.ptz_speed = max(1, self.ptz_speed - 1)
-            self.statusBar().showMessage(f"PTZ Speed: {self.ptz_speed}/9", 2000)
+            self.statusBar().showMessage(_PTZ_SPEED_FMT % self.ptz_speed, 2000)
             logger.info(f"PTZ speed decreased: {self.ptz_speed}/9")
-        elif action == 'up':
-            self.ptz_controller.move_up(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Up", 1000)
-        elif action == 'down':
-            self.ptz_controller.move_down(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Down", 1000)
-        elif action == 'left':
-            self.ptz_controller.move_left(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Left", 1000)
-        elif action == 'right':
-            self.ptz_controller.move_right(self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Right", 1000)
-        elif action == 'pan_left':
-            self.ptz_controller.send_command("UPLEFT", self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Up-Left", 1000)
-        elif action == 'right_up':
-            self.ptz_controller.send_command("UPRIGHT", self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Up-Right", 1000)
-        elif action == 'pan_down':
-            self.ptz_controller.send_command("DOWNLEFT", self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Down-Left", 1000)
-        elif action == 'right_down':
-            self.ptz_controller.send_command("DOWNRIGHT", self.ptz_speed)
-            self.statusBar().showMessage(f"PTZ: Down-Right", 1000)
-        elif action == 'stop':
-            self.ptz_controller.stop()
-            self.statusBar().showMessage(f"PTZ: Stop", 1000)
-
-        logger.debug(f"PTZ action executed: {action} (pressed={pressed}, speed={self.ptz_speed})")
+        else:
+            handler = _PTZ_PRESS_HANDLERS.get(action)
+            if handler is not None:
+                handler(self.ptz_controller, self.ptz_speed)
+                message = _PTZ_MESSAGES[action]
+                if action in _PTZ_ZOOM_ACTIONS:
+                    message = message % self.ptz_speed
+                self._show_ptz_status(message)
+
+        logger.debug("PTZ action executed: {} (pressed={}, speed={})", action, pressed, self.ptz_speed)
+
+    def _show_ptz_status(self, message: str):
+        """
+        PTZ 동작 상태바 메시지 표시 (1초)
+
+        키를 연타하는 동안 같은 메시지는 최소 간격 내 재표시하지 않음 (상태바 repaint 감소)
+        """
+        now = time.monotonic()
+        last_message, last_time = self._last_ptz_status
+        if message == last_message and now - last_time < _PTZ_STATUS_MIN_INTERVAL:
+            return
+        self._last_ptz_status = (message, now)
+        self.statusBar().showMessage(message, 1000)
 
     def _get_key_string(self, event):
         """
         키 이벤트를 문자열로 변환
         F1-F12, Esc 등 특수 키를 처리
         """
-        key = event.key()
-
-        # F1-F12 키 처리
-        if Qt.Key_F1 <= key <= Qt.Key_F12:
-            return f"F{key - Qt.Key_F1 + 1}"
-
-        # 특수 키 매핑
-        special_keys = {
-            Qt.Key_Escape: "Esc",
-            Qt.Key_Return: "Enter",
-            Qt.Key_Enter: "Enter",
-            Qt.Key_Tab: "Tab",
-            Qt.Key_Backspace: "Backspace",
-            Qt.Key_Delete: "Delete",
-            Qt.Key_Home: "Home",
-            Qt.Key_End: "End",
-            Qt.Key_PageUp: "PageUp",
-            Qt.Key_PageDown: "PageDown",
-            Qt.Key_Up: "Up",
-            Qt.Key_Down: "Down",
-            Qt.Key_Left: "Left",
-            Qt.Key_Right: "Right",
-            Qt.Key_Space: "Space"
-        }
-
-        if key in special_keys:
-            return special_keys[key]
-
-        # 일반 문자 키
-        return event.text()
+        # 특수 키/F1-F12는 모듈 상수 테이블, 그 외는 일반 문자 키
+        return _SPECIAL_KEYS.get(event.key()) or event.text()
 
     def _execute_menu_action(self, action: str) -> bool:
         """
@@ -1548,82 +2156,84 @@ class MainWindow(QMainWindow):
         """
         logger.info(f"Executing menu action: {action}")
 
-        # program_exit 처리
-        if action == "program_exit":
-            logger.info("Program exit requested via hotkey")
-            self.close()
-            return True
-
-        # camera_connect 처리
-        elif action == "camera_connect":
-            if self.camera_list.current_camera_id:
-                self.camera_list._connect_camera()
-            return True
-
-        # camera_stop 처리
-        elif action == "camera_stop":
-            if self.camera_list.current_camera_id:
-                self.camera_list._disconnect_camera()
-            return True
-
-        # camera_connect_all 처리
-        elif action == "camera_connect_all":
-            self.camera_list._connect_all()
-            return True
-
-        # camera_stop_all 처리
-        elif action == "camera_stop_all":
-            self.camera_list._disconnect_all()
-            return True
-
-        # record_start 처리
-        elif action == "record_start":
-            self.recording_control._start_recording()
-            return True
-
-        # record_stop 처리
-        elif action == "record_stop":
-            self.recording_control._stop_recording()
-            return True
-
-        # screen_hide 처리
-        elif action == "screen_hide":
-            # 전체화면 모드에서 나가기
-            if self.isFullScreen():
-                self.grid_view.exit_fullscreen()
-            return True
+        handler = self._menu_action_table.get(action)
+        if handler is None:
+            # TODO: 다른 액션들 구현
+            # prev_group, next_group, prev_config, next_config
+            # screen_rotate, screen_flip
+            logger.warning(f"Menu action not implemented: {action}")
+            return False
+
+        handler()
+        return True
+
+    def _build_menu_action_table(self) -> dict:
+        """
+        메뉴 액션 → 처리 함수 테이블 생성 (camera_list/recording_control 생성 후 1회)
+
+        Returns:
+            dict: 액션 이름 → 인자 없는 callable
+        """
+        return {
+            "program_exit": self._menu_program_exit,
+            "camera_connect": self._menu_camera_connect,
+            "camera_stop": self._menu_camera_stop,
+            "camera_connect_all": self.camera_list._connect_all,
+            "camera_stop_all": self.camera_list._disconnect_all,
+            "record_start": self.recording_control._start_recording,
+            "record_stop": self.recording_control._stop_recording,
+            "screen_hide": self._menu_screen_hide,
+            "menu_open": self.toggle_fullscreen,  # F11 - 전체화면 토글
+        }
+
+    def _menu_program_exit(self):
+        """program_exit 처리"""
+        logger.info("Program exit requested via hotkey")
+        self.close()
 
-        # menu_open 처리 (F11 - 전체화면 토글)
-        elif action == "menu_open":
-            self.toggle_fullscreen()
-            return True
+    def _menu_camera_connect(self):
+        """camera_connect 처리"""
+        if self.camera_list.current_camera_id:
+            self.camera_list._connect_camera()
 
-        # TODO: 다른 액션들 구현
-        # prev_group, next_group, prev_config, next_config
-        # screen_rotate, screen_flip
+    def _menu_camera_stop(self):
+        """camera_stop 처리"""
+        if self.camera_list.current_camera_id:
+            self.camera_list._disconnect_camera()
 
-        logger.warning(f"Menu action not implemented: {action}")
-        return False
+    def _menu_screen_hide(self):
+        """screen_hide 처리 (전체화면 모드에서 나가기)"""
+        if self.isFullScreen():
+            self.grid_view.exit_fullscreen()
 
     def closeEvent(self, event: QCloseEvent):
         """Handle application close event"""
         logger.info("Shutting down application...")
 
-        # Dock 상태 저장
+        # Save dock state (종료 시에는 동기 저장 - 대기 중인 디바운스 저장은 취소)
+        self._save_timer.stop()
         self._save_dock_state()
 
         # Stop timers
-        if self.status_timer:
-            self.status_timer.stop()
-
-        if hasattr(self, 'clock_timer') and self.clock_timer:
+        if self.clock_timer is not None:
             self.clock_timer.stop()
 
-        if hasattr(self, 'cleanup_timer') and self.cleanup_timer:
+        if self.cleanup_timer is not None:
             self.cleanup_timer.stop()
             logger.info("Cleanup timer stopped")
 
-        if hasattr(self, 'ui_hide_timer') and self.ui_hide_timer:
+        # 예약된 자동 녹화 취소
+        self._auto_record_timer.stop()
+        self._pending_auto_record.clear()
+
+        # 실행 중인 자동 정리가 있으면 중단 요청 후 대기 (진행 중인 삭제 1건은 마무리)
+        if self.cleanup_thread and self.cleanup_thread.isRunning():
+            logger.info("Stopping auto cleanup...")
+            self.cleanup_thread.requestInterruption()
+            if not self.cleanup_thread.wait(5000):
+                logger.warning("Auto cleanup did not stop within 5s - continuing shutdown")
+
+        if self.ui_hide_timer is not None:
             self.ui_hide_timer.stop()
             logger.info("UI hide timer stopped")
 
@@ -1635,12 +2245,47 @@ class MainWindow(QMainWindow):
         if self.playback_widget:
             self.playback_widget.cleanup()
 
-        # Disconnect all cameras
-        self.camera_list._disconnect_all()
+        # Disconnect all cameras (병렬 처리: 종료 시간이 카메라 수에 비례하지 않도록)
+        self._disconnect_streams_parallel(timeout=5.0)
 
         # NOTE: save_config() 제거됨
         # 프로그램 종료 시 자동 저장하면 cameras가 비어있을 때 설정이 초기화되는 문제 발생
         # 설정은 UI에서 카메라 추가/제거 시에만 저장됨
 
         event.accept()
-        logger.info("Application closed")
\ No newline at end of file
+        logger.info("Application closed")
+
+    def _disconnect_streams_parallel(self, timeout: float):
+        """
+        연결된 모든 카메라 스트림을 병렬로 해제
+
+        파이프라인 NULL 전환/RTSP TEARDOWN이 카메라마다 수백 ms~수 초 걸릴 수 있으므로
+        순차 해제 대신 스레드 풀로 동시에 해제하여 종료 시간을 가장 느린 1개 수준으로 제한
+
+        stop()은 녹화 중이면 split-after 후 NULL 전환으로 MP4(moov)를 마무리하므로
+        중간에 끊지 않고 모든 해제가 끝날 때까지 기다림 (timeout은 느린 카메라 로그용)
+
+        Args:
+            timeout: 느린 카메라 경고를 남기기까지의 대기 시간 (초)
+        """
+        streams = [stream for stream in self.camera_list.camera_streams.values()
+                   if stream.is_connected()]
+        if not streams:
+            return
+
+        # 스토리지 콜백 해제는 위젯 상태를 건드리므로 GUI 스레드에서 먼저 처리
+        # (위젯 참조를 떼어 워커 스레드의 disconnect()가 다시 호출하지 않도록 함)
+        for stream in streams:
+            if stream.recording_control_widget:
+                stream.recording_control_widget.unregister_storage_error_callback(stream.config.camera_id)
+                stream.recording_control_widget = None
+
+        with ThreadPoolExecutor(max_workers=len(streams), thread_name_prefix="disconnect") as executor:
+            futures = {executor.submit(stream.disconnect): stream.config.camera_id for stream in streams}
+            _, not_done = wait(futures, timeout=timeout)
+            if not_done:
+                slow = [futures[future] for future in not_done]
+                logger.warning(f"{len(slow)} camera(s) still disconnecting after {timeout}s, waiting: {slow}")
+        # with 블록 종료 시 모든 워커 join (녹화 파일 마무리 보장)
+
+        logger.info(f"Disconnected {len(streams)} camera(s)")
\ No newline at end of file
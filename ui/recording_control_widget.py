@@ -3,10 +3,6 @@
 녹화 시작/정지 및 상태 표시
 """
 
-import sys
-from pathlib import Path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
 from PyQt5.QtWidgets import (
     QVBoxLayout, QGroupBox,
     QLabel, QMenu, QAction,
@@ -31,6 +31,7 @@ class ThemeManager(QObject):
             return
         super().__init__()
         self._current_theme = 'dark'
+        self._stylesheet_cache = {}  # theme -> QSS 문자열 (테마별 1회만 생성)
         self._initialized = True
 
     @property
@@ -76,12 +77,16 @@ class ThemeManager(QObject):
 
     def get_application_stylesheet(self) -> str:
         """
-        전체 애플리케이션 스타일시트 생성
+        전체 애플리케이션 스타일시트 생성 (테마별로 1회만 생성 후 캐시)
 
         Returns:
             모든 위젯 스타일을 포함한 QSS 문자열
         """
         theme = self._current_theme
+        cached = self._stylesheet_cache.get(theme)
+        if cached is not None:
+            return cached
+
         styles = StyleTemplates
 
         # 모든 위젯 스타일 조합
@@ -124,6 +129,7 @@ class ThemeManager(QObject):
             {styles.get_progressbar_style(theme)}
         """
 
+        self._stylesheet_cache[theme] = stylesheet
         return stylesheet
 
     def get_widget_style(self, widget_type: str) -> str: